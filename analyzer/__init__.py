@@ -2,12 +2,13 @@
 
 The QSOAnalyzer class is the orchestration core; pure geometry/utility
 helpers live in `geometry` so they're reusable and don't drag the locked
-spot caches around.
+spot caches around. `passband` holds the band map's array-backed spot
+store and passband math.
 
 Copyright (C) 2025 Peter Hirst (WU2C)
 """
 
 from .core import QSOAnalyzer
-from . import geometry
+from . import geometry, passband
 
-__all__ = ["QSOAnalyzer", "geometry"]
+__all__ = ["QSOAnalyzer", "geometry", "passband"]
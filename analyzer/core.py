@@ -61,6 +61,47 @@ def count_unique_reporters_near(reports: List[Dict],
                 and r.get('grid', '')[:2] == target_field})
 
 
+def first_report_by_receiver(reports: List[Dict]) -> Dict[str, Dict]:
+    """receiver -> its earliest report in `reports` (list order).
+
+    The path checks ask "did <call> report me?" on every decode; this
+    index answers with one dict lookup instead of a scan, returning the
+    same report a front-to-back scan would find first.
+    """
+    index = {}
+    for r in reports:
+        index.setdefault(r.get('receiver', ''), r)
+    return index
+
+
+# Hard cap on distinct senders held in the sender and band caches:
+# least-recently-heard eviction with a 5-minute grace window. Senders
+# heard within the longest live query window (find_near_me_stations
+# looks back 5 minutes; the perspective tiers 3) are never evicted.
+MAX_TRACKED_SENDERS = 4096
+SENDER_EVICTION_GRACE_S = 5 * 60
+
+
+def senders_to_evict(sender_cache: Dict[str, List[Dict]], cap: int,
+                     pinned=(), protect_after: float = float('inf')) -> set:
+    """Pick the senders to drop so at most `cap` remain, where possible.
+
+    Least-recently heard first, ties broken by fewest spots. Pinned
+    senders and senders heard after `protect_after` are never chosen,
+    so the cap may be exceeded while the band is that busy.
+    """
+    excess = len(sender_cache) - cap
+    if excess <= 0:
+        return set()
+    candidates = []
+    for call, spots in sender_cache.items():
+        last_heard = max((r.get('time', 0) for r in spots), default=0)
+        if call not in pinned and last_heard <= protect_after:
+            candidates.append((last_heard, len(spots), call))
+    candidates.sort()
+    return {call for _, _, call in candidates[:excess]}
+
+
 class QSOAnalyzer(QObject):
     cache_updated = pyqtSignal()
     status_message = pyqtSignal(str)
@@ -95,6 +136,8 @@ class QSOAnalyzer(QObject):
         self.current_target_grid = ""  # v2.2.0: Set by main when target changes
         self.band_cache = {}      
         self.my_reception_cache = [] 
+        # receiver -> first report in my_reception_cache; rebuilt on prune
+        self._my_reception_by_receiver = {}
         
         # --- NEW: Target Perspective Caches ---
         # Keyed by receiver callsign -> list of spots (spots reported by each receiver)
@@ -104,6 +147,9 @@ class QSOAnalyzer(QObject):
         # v2.1.0: Keyed by sender callsign -> list of spots (who reports that station)
         # Used for Phase 2 Path Intelligence reverse lookups
         self.sender_cache = {}
+        # sender -> last on-band spot time; drives the status bar's
+        # "Tracking N stations" between prunes (and survives eviction)
+        self._sender_last_heard = {}
         
         # --- Local Decode Path Evidence (v2.1.3) ---
         # When we decode "WU2C DH2YBG JO43", FT8 format is TO FROM payload.
@@ -119,8 +165,14 @@ class QSOAnalyzer(QObject):
         # Subscribe to 20m default to catch startup traffic
         self.mqtt.update_subscriptions(self.my_call, 14074000)
         
-        self.worker_thread = threading.Thread(target=self._maintenance_loop, daemon=True)
-        self.worker_thread.start()
+        # Pruning and status reporting run on separate daemon threads so
+        # each keeps its own cadence (see PRUNE_INTERVAL_S).
+        self._senders_evicted = 0
+        self._prune_cycle = 0
+        self.prune_thread = threading.Thread(target=self._prune_loop, daemon=True)
+        self.prune_thread.start()
+        self.status_thread = threading.Thread(target=self._status_loop, daemon=True)
+        self.status_thread.start()
 
     def set_dial_freq(self, freq):
         if self.current_dial_freq != freq:
@@ -129,12 +181,14 @@ class QSOAnalyzer(QObject):
                 self.current_dial_freq = freq
                 self.band_cache.clear()
                 self.my_reception_cache.clear()
+                self._my_reception_by_receiver.clear()
                 self.receiver_cache.clear()
                 self.grid_cache.clear()
                 self.sender_cache.clear()  # v2.1.0: Phase 2 reverse lookup cache
                 self.decode_evidence.clear()   # v2.1.3: Local decode path evidence
                 self.call_grid_map.clear()
                 self.responded_to_me.clear()
+                self._sender_last_heard.clear()
             
             self.mqtt.update_subscriptions(self.my_call, freq)
             self.cache_updated.emit()
@@ -158,12 +212,14 @@ class QSOAnalyzer(QObject):
             self.my_grid = my_grid
             self.band_cache.clear()
             self.my_reception_cache.clear()
+            self._my_reception_by_receiver.clear()
             self.receiver_cache.clear()
             self.grid_cache.clear()
             self.sender_cache.clear()
             self.decode_evidence.clear()
             self.call_grid_map.clear()
             self.responded_to_me.clear()
+            self._sender_last_heard.clear()
         self.mqtt.update_subscriptions(
             self.my_call, self.current_dial_freq or 14074000)
         self.cache_updated.emit()
@@ -199,13 +255,25 @@ class QSOAnalyzer(QObject):
                 if (spot['sender'] == self.my_call
                         and spot_is_on_dial_band(spot_freq,
                                                  self.current_dial_freq)):
+                    # Grid prefixes sliced once here; the path checks in
+                    # analyze_decode/update_path_only compare them on
+                    # every decode.
+                    grid = spot.get('grid', '')
+                    spot['_gminor'] = grid[:4] if len(grid) >= 4 else ''
+                    spot['_gmajor'] = grid[:2] if len(grid) >= 2 else ''
                     self.my_reception_cache.append(spot)
+                    self._my_reception_by_receiver.setdefault(
+                        spot.get('receiver', ''), spot)
 
                 # Original band_cache (keyed by frequency)
                 if spot_is_on_dial_band(spot_freq, self.current_dial_freq):
                     if spot_freq not in self.band_cache:
                         self.band_cache[spot_freq] = []
                     self.band_cache[spot_freq].append(spot)
+                    if isinstance(spot.get('time'), (int, float)):
+                        self._sender_last_heard[spot['sender']] = max(
+                            spot['time'],
+                            self._sender_last_heard.get(spot['sender'], 0))
                     
                     # --- NEW: Populate receiver_cache ---
                     if receiver_call:
@@ -227,10 +295,11 @@ class QSOAnalyzer(QObject):
                             self.sender_cache[sender_call] = []
                         self.sender_cache[sender_call].append(spot)
             
+                # Counter is read by the prune thread's health log
+                self._spots_processed += 1
+            
             # v2.1.0: Emit for hunt mode checking (outside lock)
             self.spot_received.emit(spot)
-            
-            self._spots_processed += 1
                         
         except Exception as e:
             if not self._spot_error_logged:
@@ -822,10 +891,11 @@ class QSOAnalyzer(QObject):
         if parts[0].upper() == 'CQ':
             return
         
-        to_call = parts[0].strip('<>').upper()
-        from_call = parts[1].strip('<>').upper()
+        # Memoized: the same calls repeat every decode cycle
+        to_call = geometry.message_call(parts[0])
+        from_call = geometry.message_call(parts[1])
         
-        if not geometry.is_callsign(to_call) or not geometry.is_callsign(from_call):
+        if not to_call or not from_call:
             return
         
         # Record: FROM responded to TO (FROM decoded TO)
@@ -972,7 +1042,7 @@ class QSOAnalyzer(QObject):
         direct_hit = False
         
         with self.lock:
-            my_reception_snapshot = list(self.my_reception_cache)
+            my_reception_snapshot, target_rep = self._recent_reception(target_call)
             
             # Check if there are any reporters near target
             has_nearby_reporters = False
@@ -997,15 +1067,13 @@ class QSOAnalyzer(QObject):
         my_snr_at_target = None
         my_snr_reporter = None
         path_heard_time = 0  # v2.5.1: When the "heard" spot was received
-        for my_rep in my_reception_snapshot:
-            if my_rep['receiver'] == target_call:
-                geo_bonus = 100
-                direct_hit = True
-                path_str = "Heard by Target"
-                my_snr_at_target = my_rep.get('snr', None)
-                my_snr_reporter = target_call
-                path_heard_time = my_rep.get('time', 0)
-                break
+        if target_rep is not None:
+            geo_bonus = 100
+            direct_hit = True
+            path_str = "Heard by Target"
+            my_snr_at_target = target_rep.get('snr', None)
+            my_snr_reporter = target_call
+            path_heard_time = target_rep.get('time', 0)
         
         # Check for path open (nearby station heard us)
         if not direct_hit and target_grid and len(target_grid) >= 2:
@@ -1013,26 +1081,27 @@ class QSOAnalyzer(QObject):
             target_minor = target_grid[:4] if len(target_grid) >= 4 else ""
             
             for my_rep in my_reception_snapshot:
-                r_grid = my_rep.get('grid', "")
-                if len(r_grid) >= 4:
-                    if target_minor and r_grid[:4] == target_minor:
+                r_minor = my_rep['_gminor']
+                r_major = my_rep['_gmajor']
+                if r_minor:
+                    if target_minor and r_minor == target_minor:
                         geo_bonus = 25 
                         path_str = "Reported in Region"
                         my_snr_at_target = my_rep.get('snr', None)
                         my_snr_reporter = my_rep.get('receiver', '')
                         path_heard_time = my_rep.get('time', 0)
                         break
-                    elif r_grid[:2] == target_major:
+                    elif r_major == target_major:
                         geo_bonus = 15
                         path_str = "Reported in Region"
                         my_snr_at_target = my_rep.get('snr', None)
                         my_snr_reporter = my_rep.get('receiver', '')
                         path_heard_time = my_rep.get('time', 0)
-                elif len(r_grid) >= 2:
+                elif r_major:
                     # v2.4.4: Catch reporters with short grids (2-3 chars)
                     # Previously skipped by the len>=4 gate, causing status bar
                     # to show "near target" while path showed "Not Reported"
-                    if r_grid[:2] == target_major:
+                    if r_major == target_major:
                         geo_bonus = 10  # Lower confidence than full grid match
                         path_str = "Reported in Region"
                         my_snr_at_target = my_rep.get('snr', None)
@@ -1213,7 +1282,7 @@ class QSOAnalyzer(QObject):
         path_str = ""
         
         with self.lock:
-            my_reception_snapshot = list(self.my_reception_cache)
+            my_reception_snapshot, target_rep = self._recent_reception(target_call)
             
             # Check if there are any reporters near target
             has_nearby_reporters = False
@@ -1237,12 +1306,10 @@ class QSOAnalyzer(QObject):
         # Check for direct connection (target heard us)
         my_snr_at_target = None
         my_snr_reporter = None
-        for my_rep in my_reception_snapshot:
-            if my_rep['receiver'] == target_call:
-                path_str = "Heard by Target"
-                my_snr_at_target = my_rep.get('snr', None)
-                my_snr_reporter = target_call
-                break
+        if target_rep is not None:
+            path_str = "Heard by Target"
+            my_snr_at_target = target_rep.get('snr', None)
+            my_snr_reporter = target_call
         
         # Check for path open (nearby station heard us)
         if not path_str and target_grid and len(target_grid) >= 2:
@@ -1250,20 +1317,21 @@ class QSOAnalyzer(QObject):
             target_minor = target_grid[:4] if len(target_grid) >= 4 else ""
             
             for my_rep in my_reception_snapshot:
-                r_grid = my_rep.get('grid', "")
-                if len(r_grid) >= 4:
-                    if target_minor and r_grid[:4] == target_minor:
+                r_minor = my_rep['_gminor']
+                r_major = my_rep['_gmajor']
+                if r_minor:
+                    if target_minor and r_minor == target_minor:
                         path_str = "Reported in Region"
                         my_snr_at_target = my_rep.get('snr', None)
                         my_snr_reporter = my_rep.get('receiver', '')
                         break
-                    elif r_grid[:2] == target_major:
+                    elif r_major == target_major:
                         path_str = "Reported in Region"
                         my_snr_at_target = my_rep.get('snr', None)
                         my_snr_reporter = my_rep.get('receiver', '')
-                elif len(r_grid) >= 2:
+                elif r_major:
                     # v2.4.4: Catch reporters with short grids (2-3 chars)
-                    if r_grid[:2] == target_major:
+                    if r_major == target_major:
                         path_str = "Reported in Region"
                         my_snr_at_target = my_rep.get('snr', None)
                         my_snr_reporter = my_rep.get('receiver', '')
@@ -1308,8 +1376,8 @@ class QSOAnalyzer(QObject):
             if target_grid and my_snr_reporter:
                 for my_rep in my_reception_snapshot:
                     if my_rep.get('receiver', '') == my_snr_reporter:
-                        r_grid = my_rep.get('grid', '')
-                        if len(r_grid) >= 4 and len(target_grid) >= 4 and r_grid[:4] == target_grid[:4]:
+                        r_minor = my_rep['_gminor']
+                        if r_minor and len(target_grid) >= 4 and r_minor == target_grid[:4]:
                             geo_bonus = 25  # Same grid
                         else:
                             geo_bonus = 15  # Same field
@@ -1334,179 +1402,262 @@ class QSOAnalyzer(QObject):
         self.running = False
         self.mqtt.stop()
 
-    def _maintenance_loop(self):
+    # Cache pruning walks every spot in every cache; it only needs to keep
+    # up with the 15-minute retention, so it runs far less often than the
+    # status bar refresh (which also drives refresh_paths in the UI).
+    PRUNE_INTERVAL_S = 10
+    STATUS_INTERVAL_S = 2
+    _HEALTH_LOG_EVERY = 3   # prune cycles (~30 s)
+
+    def _prune_loop(self):
         """
         Background thread that cleans up expired spots from caches.
         FIX v2.0.4: Wrapped in try/except to prevent thread death from bad data.
         """
         while self.running:
-            time.sleep(2) 
-            
+            time.sleep(self.PRUNE_INTERVAL_S)
             try:
-                now = time.time()
-                cutoff = now - (15 * 60)  # Keep 15 mins for BAND MAP history
-                cutoff_recent = now - (3 * 60)  # Keep 3 mins for "who reports me" (tactical relevance)
-                
-                # LOCK: Modifying cache
-                with self.lock:
-                    # --- Original band_cache cleanup ---
-                    keys_to_remove = []
-                    unique_senders = set()  # FIX v2.0.4: Count unique callsigns, not total spots
-                    for f in self.band_cache:
-                        # FIX v2.0.4: Safe comparison - skip spots with invalid time
-                        self.band_cache[f] = [
-                            r for r in self.band_cache[f] 
-                            if isinstance(r.get('time'), (int, float)) and r['time'] > cutoff
-                        ]
-                        if not self.band_cache[f]:
-                            keys_to_remove.append(f)
-                        else:
-                            # Count unique senders (more meaningful than total reports)
-                            for r in self.band_cache[f]:
-                                unique_senders.add(r.get('sender', ''))
-                    
-                    for k in keys_to_remove:
-                        del self.band_cache[k]
-                    
-                    # Use shorter window for "who reports me" - recent propagation matters
-                    # FIX v2.0.4: Safe comparison
-                    self.my_reception_cache = [
-                        r for r in self.my_reception_cache
-                        if isinstance(r.get('time'), (int, float)) and r['time'] > cutoff_recent
-                    ]
-                    # v2.7.0: unique receivers, not raw report count —
-                    # see count_unique_reporters.
-                    reporting_me_count = count_unique_reporters(
-                        self.my_reception_cache)
-
-                    # v2.2.0: Count how many reporters are near current target
-                    near_target_count = 0
-                    if self.current_target_grid and len(self.current_target_grid) >= 2:
-                        near_target_count = count_unique_reporters_near(
-                            self.my_reception_cache,
-                            self.current_target_grid[:2])
-                    
-                    # --- NEW: Cleanup receiver_cache ---
-                    receiver_keys_to_remove = []
-                    for call in self.receiver_cache:
-                        # FIX v2.0.4: Safe comparison
-                        self.receiver_cache[call] = [
-                            r for r in self.receiver_cache[call] 
-                            if isinstance(r.get('time'), (int, float)) and r['time'] > cutoff
-                        ]
-                        if not self.receiver_cache[call]:
-                            receiver_keys_to_remove.append(call)
-                    for k in receiver_keys_to_remove:
-                        del self.receiver_cache[k]
-                    
-                    # --- NEW: Cleanup grid_cache ---
-                    grid_keys_to_remove = []
-                    for grid in self.grid_cache:
-                        # FIX v2.0.4: Safe comparison
-                        self.grid_cache[grid] = [
-                            r for r in self.grid_cache[grid] 
-                            if isinstance(r.get('time'), (int, float)) and r['time'] > cutoff
-                        ]
-                        if not self.grid_cache[grid]:
-                            grid_keys_to_remove.append(grid)
-                    for k in grid_keys_to_remove:
-                        del self.grid_cache[k]
-                    
-                    # --- v2.5.5: Cleanup sender_cache ---
-                    # sender_cache was added in v2.1.0 for Phase 2 reverse lookups but
-                    # was missing from maintenance loop. Populated on every spot in
-                    # handle_live_spot (line ~144), it grew unbounded between band changes
-                    # (which clear it) — accumulating ~4 MB/min on a busy band.
-                    # Same 15-minute cutoff as other spot caches.
-                    sender_keys_to_remove = []
-                    for call in self.sender_cache:
-                        self.sender_cache[call] = [
-                            r for r in self.sender_cache[call]
-                            if isinstance(r.get('time'), (int, float)) and r['time'] > cutoff
-                        ]
-                        if not self.sender_cache[call]:
-                            sender_keys_to_remove.append(call)
-                    for k in sender_keys_to_remove:
-                        del self.sender_cache[k]
-                    
-                    # --- v2.1.3: Cleanup decode evidence caches ---
-                    evidence_to_remove = []
-                    for call, ev in self.decode_evidence.items():
-                        if ev.get('last_seen', 0) < cutoff:
-                            evidence_to_remove.append(call)
-                    for k in evidence_to_remove:
-                        del self.decode_evidence[k]
-                    
-                    resp_to_remove = [c for c, t in self.responded_to_me.items() if t < cutoff]
-                    for k in resp_to_remove:
-                        del self.responded_to_me[k]
-                    
-                    # Cap call_grid_map size (grids don't expire but shouldn't grow unbounded)
-                    if len(self.call_grid_map) > 5000:
-                        self.call_grid_map.clear()
-                    
-                    # Stats for status
-                    receiver_count = len(self.receiver_cache)
-                    grid_count = len(self.grid_cache)
-                    
-                    # Format dial frequency for display
-                    dial_display = ""
-                    if self.current_dial_freq > 0:
-                        freq_mhz = self.current_dial_freq / 1_000_000
-                        band = geometry.freq_to_band(self.current_dial_freq)
-                        dial_display = f"{band} ({freq_mhz:.3f} MHz) | "
-                
-                # v2.2.0: "reporting" not "hear"; add near-target count
-                reporting_str = f"{reporting_me_count} reporting {self.my_call}"
-                if self.current_target_grid and len(self.current_target_grid) >= 2:
-                    reporting_str += f" ({near_target_count} near target)"
-                
-                self.cache_updated.emit()
-                self.status_message.emit(
-                    f"{dial_display}Tracking {len(unique_senders)} stations | {reporting_str}"
-                )
-                
-                # Diagnostic: log cache health every ~30 seconds (every 15th cycle)
-                if not hasattr(self, '_maint_cycle'):
-                    self._maint_cycle = 0
-                self._maint_cycle += 1
-                if self._maint_cycle % 15 == 1:
-                    # v2.5.5: Append process memory to cache health for leak/accumulator diagnosis.
-                    # rss_mb = working set (RAM-resident); vms_mb = ~commit (total committed virtual mem).
-                    # On Windows, divergence between rss and vms indicates pagefile activity.
-                    mem_str = ""
-                    if self._process is not None:
-                        try:
-                            mi = self._process.memory_info()
-                            mem_str = (
-                                f", rss_mb={mi.rss / 1024**2:.0f}"
-                                f", vms_mb={mi.vms / 1024**2:.0f}"
-                            )
-                        except Exception:
-                            # Diagnostic must never kill the analyzer
-                            pass
-                    # v2.5.5: sender_cache diagnostics — populated per-spot in handle_live_spot
-                    # but historically not pruned by maintenance loop. Track both unique
-                    # senders (dict keys) and total spots stored across all entries to
-                    # quantify accumulation.
-                    sender_cache_calls = len(self.sender_cache)
-                    sender_cache_spots = sum(len(v) for v in self.sender_cache.values())
-                    logger.info(
-                        f"Analyzer cache health: spots_processed={self._spots_processed}, "
-                        f"band_cache_freqs={len(self.band_cache)}, "
-                        f"receiver_cache_calls={len(self.receiver_cache)}, "
-                        f"grid_cache_grids={len(self.grid_cache)}, "
-                        f"sender_cache_calls={sender_cache_calls}, "
-                        f"sender_cache_spots={sender_cache_spots}, "
-                        f"decode_evidence={len(self.decode_evidence)}, "
-                        f"responded_to_me={len(self.responded_to_me)}, "
-                        f"unique_senders={len(unique_senders)}, "
-                        f"dial_freq={self.current_dial_freq}, "
-                        f"spot_errors={'YES' if self._spot_error_logged else 'none'}"
-                        f"{mem_str}"
-                    )
-                
+                self._prune_caches(time.time())
             except Exception as e:
                 # FIX v2.0.4: Log error but don't die - keep cleaning
                 logger.warning(f"Maintenance: Error during cleanup: {e}")
                 # Continue running - next iteration may succeed
+
+    def _status_loop(self):
+        """Background thread that emits cache_updated and the status line.
+
+        Reads only the small reception cache and the per-sender last-heard
+        times, so the 2 s cadence stays cheap on busy bands.
+        """
+        while self.running:
+            time.sleep(self.STATUS_INTERVAL_S)
+            try:
+                self._emit_status(time.time())
+            except Exception as e:
+                logger.warning(f"Maintenance: Error during status update: {e}")
+
+    def _prune_caches(self, now):
+        cutoff = now - (15 * 60)  # Keep 15 mins for BAND MAP history
+        cutoff_recent = now - (3 * 60)  # Keep 3 mins for "who reports me" (tactical relevance)
+
+        # LOCK: Modifying cache
+        with self.lock:
+            # --- Original band_cache cleanup ---
+            keys_to_remove = []
+            for f in self.band_cache:
+                # FIX v2.0.4: Safe comparison - skip spots with invalid time
+                self.band_cache[f] = [
+                    r for r in self.band_cache[f] 
+                    if isinstance(r.get('time'), (int, float)) and r['time'] > cutoff
+                ]
+                if not self.band_cache[f]:
+                    keys_to_remove.append(f)
+            
+            for k in keys_to_remove:
+                del self.band_cache[k]
+            
+            stale_senders = [c for c, t in self._sender_last_heard.items() if t <= cutoff]
+            for k in stale_senders:
+                del self._sender_last_heard[k]
+            
+            # Use shorter window for "who reports me" - recent propagation matters
+            # FIX v2.0.4: Safe comparison
+            self.my_reception_cache = [
+                r for r in self.my_reception_cache
+                if isinstance(r.get('time'), (int, float)) and r['time'] > cutoff_recent
+            ]
+            self._my_reception_by_receiver = first_report_by_receiver(
+                self.my_reception_cache)
+            
+            # --- NEW: Cleanup receiver_cache ---
+            receiver_keys_to_remove = []
+            for call in self.receiver_cache:
+                # FIX v2.0.4: Safe comparison
+                self.receiver_cache[call] = [
+                    r for r in self.receiver_cache[call] 
+                    if isinstance(r.get('time'), (int, float)) and r['time'] > cutoff
+                ]
+                if not self.receiver_cache[call]:
+                    receiver_keys_to_remove.append(call)
+            for k in receiver_keys_to_remove:
+                del self.receiver_cache[k]
+            
+            # --- NEW: Cleanup grid_cache ---
+            grid_keys_to_remove = []
+            for grid in self.grid_cache:
+                # FIX v2.0.4: Safe comparison
+                self.grid_cache[grid] = [
+                    r for r in self.grid_cache[grid] 
+                    if isinstance(r.get('time'), (int, float)) and r['time'] > cutoff
+                ]
+                if not self.grid_cache[grid]:
+                    grid_keys_to_remove.append(grid)
+            for k in grid_keys_to_remove:
+                del self.grid_cache[k]
+            
+            # --- v2.5.5: Cleanup sender_cache ---
+            # sender_cache was added in v2.1.0 for Phase 2 reverse lookups but
+            # was missing from maintenance loop. Populated on every spot in
+            # handle_live_spot (line ~144), it grew unbounded between band changes
+            # (which clear it) — accumulating ~4 MB/min on a busy band.
+            # Same 15-minute cutoff as other spot caches.
+            sender_keys_to_remove = []
+            for call in self.sender_cache:
+                self.sender_cache[call] = [
+                    r for r in self.sender_cache[call]
+                    if isinstance(r.get('time'), (int, float)) and r['time'] > cutoff
+                ]
+                if not self.sender_cache[call]:
+                    sender_keys_to_remove.append(call)
+            for k in sender_keys_to_remove:
+                del self.sender_cache[k]
+            
+            # Bound the caches on crowded bands: drop the stalest senders,
+            # never one a live query can still see (my own spots feed the
+            # reception cache and are pinned). The status count comes from
+            # _sender_last_heard, so it still reports every station heard.
+            evicted = senders_to_evict(self.sender_cache, MAX_TRACKED_SENDERS,
+                                       pinned={(self.my_call or '').upper()},
+                                       protect_after=now - SENDER_EVICTION_GRACE_S)
+            if evicted:
+                self._evict_senders(evicted)
+            
+            # --- v2.1.3: Cleanup decode evidence caches ---
+            evidence_to_remove = []
+            for call, ev in self.decode_evidence.items():
+                if ev.get('last_seen', 0) < cutoff:
+                    evidence_to_remove.append(call)
+            for k in evidence_to_remove:
+                del self.decode_evidence[k]
+            
+            resp_to_remove = [c for c, t in self.responded_to_me.items() if t < cutoff]
+            for k in resp_to_remove:
+                del self.responded_to_me[k]
+            
+            # Cap call_grid_map size (grids don't expire but shouldn't grow unbounded)
+            if len(self.call_grid_map) > 5000:
+                self.call_grid_map.clear()
+
+        # Diagnostic: log cache health every ~30 seconds
+        self._prune_cycle += 1
+        if self._prune_cycle % self._HEALTH_LOG_EVERY == 1:
+            self._log_cache_health()
+
+    def _evict_senders(self, evicted):
+        """Remove `evicted` senders' spots from the sender and band caches.
+
+        receiver_cache and grid_cache keep them: the path checks ask
+        whether any reporter near the target spotted anything in the
+        15-minute window, with no time filter, and eviction must not
+        change that answer. Caller holds the lock.
+        """
+        for call in evicted:
+            del self.sender_cache[call]
+        for key in list(self.band_cache):
+            kept = [r for r in self.band_cache[key]
+                    if r.get('sender', '').upper() not in evicted]
+            if kept:
+                self.band_cache[key] = kept
+            else:
+                del self.band_cache[key]
+        self._senders_evicted += len(evicted)
+
+    def _recent_reception(self, target_call):
+        """Reports of me from the last 3 minutes, and target_call's first one.
+
+        my_reception_cache and its receiver index are only pruned every
+        PRUNE_INTERVAL_S, so the window is re-applied here, as in
+        _emit_status. Caller holds the lock.
+        """
+        cutoff_recent = time.time() - (3 * 60)
+        recent = [
+            r for r in self.my_reception_cache
+            if isinstance(r.get('time'), (int, float)) and r['time'] > cutoff_recent
+        ]
+        target_rep = self._my_reception_by_receiver.get(target_call)
+        if target_rep is not None and not (
+                isinstance(target_rep.get('time'), (int, float))
+                and target_rep['time'] > cutoff_recent):
+            # Earliest report has aged out; a later one may still count
+            target_rep = next((r for r in recent
+                               if r.get('receiver', '') == target_call), None)
+        return recent, target_rep
+
+    def _emit_status(self, now):
+        cutoff_recent = now - (3 * 60)
+        with self.lock:
+            # The reception cache is only pruned every PRUNE_INTERVAL_S,
+            # so apply the 3-minute window here as well.
+            recent = [
+                r for r in self.my_reception_cache
+                if isinstance(r.get('time'), (int, float)) and r['time'] > cutoff_recent
+            ]
+            # v2.7.0: unique receivers, not raw report count —
+            # see count_unique_reporters.
+            reporting_me_count = count_unique_reporters(recent)
+
+            # v2.2.0: Count how many reporters are near current target
+            near_target_count = 0
+            if self.current_target_grid and len(self.current_target_grid) >= 2:
+                near_target_count = count_unique_reporters_near(
+                    recent, self.current_target_grid[:2])
+
+            # Format dial frequency for display
+            dial_display = ""
+            if self.current_dial_freq > 0:
+                freq_mhz = self.current_dial_freq / 1_000_000
+                band = geometry.freq_to_band(self.current_dial_freq)
+                dial_display = f"{band} ({freq_mhz:.3f} MHz) | "
+            # FIX v2.0.4: Count unique callsigns, not total spots. Counted
+            # on every emit, so new stations show without waiting for a prune.
+            cutoff = now - (15 * 60)
+            unique_sender_count = sum(
+                1 for t in self._sender_last_heard.values() if t > cutoff)
+
+        # v2.2.0: "reporting" not "hear"; add near-target count
+        reporting_str = f"{reporting_me_count} reporting {self.my_call}"
+        if self.current_target_grid and len(self.current_target_grid) >= 2:
+            reporting_str += f" ({near_target_count} near target)"
+        
+        self.cache_updated.emit()
+        self.status_message.emit(
+            f"{dial_display}Tracking {unique_sender_count} stations | {reporting_str}"
+        )
+
+    def _log_cache_health(self):
+        # v2.5.5: Append process memory to cache health for leak/accumulator diagnosis.
+        # rss_mb = working set (RAM-resident); vms_mb = ~commit (total committed virtual mem).
+        # On Windows, divergence between rss and vms indicates pagefile activity.
+        mem_str = ""
+        if self._process is not None:
+            try:
+                mi = self._process.memory_info()
+                mem_str = (
+                    f", rss_mb={mi.rss / 1024**2:.0f}"
+                    f", vms_mb={mi.vms / 1024**2:.0f}"
+                )
+            except Exception:
+                # Diagnostic must never kill the analyzer
+                pass
+        with self.lock:
+            # v2.5.5: sender_cache diagnostics — populated per-spot in handle_live_spot
+            # but historically not pruned by maintenance loop. Track both unique
+            # senders (dict keys) and total spots stored across all entries to
+            # quantify accumulation.
+            sender_cache_calls = len(self.sender_cache)
+            sender_cache_spots = sum(len(v) for v in self.sender_cache.values())
+            logger.info(
+                f"Analyzer cache health: spots_processed={self._spots_processed}, "
+                f"band_cache_freqs={len(self.band_cache)}, "
+                f"receiver_cache_calls={len(self.receiver_cache)}, "
+                f"grid_cache_grids={len(self.grid_cache)}, "
+                f"sender_cache_calls={sender_cache_calls}, "
+                f"sender_cache_spots={sender_cache_spots}, "
+                f"decode_evidence={len(self.decode_evidence)}, "
+                f"responded_to_me={len(self.responded_to_me)}, "
+                f"unique_senders={len(self._sender_last_heard)}, "
+                f"senders_evicted={self._senders_evicted}, "
+                f"dial_freq={self.current_dial_freq}, "
+                f"spot_errors={'YES' if self._spot_error_logged else 'none'}"
+                f"{mem_str}"
+            )
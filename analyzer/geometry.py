@@ -7,6 +7,7 @@ explicitly — no MainWindow or self state.
 Copyright (C) 2025 Peter Hirst (WU2C)
 """
 
+from functools import lru_cache
 from typing import List
 
 
@@ -98,6 +99,24 @@ def is_callsign(s: str) -> bool:
     return any(c.isdigit() for c in s) and all(c.isalnum() or c == '/' for c in s)
 
 
+# The same few hundred callsigns recur in every decode cycle, so the
+# token normalizer below is memoized: each distinct token is
+# stripped/upper-cased/checked once per session instead of once per use.
+# Bounded so a long contest session can't grow the cache without limit.
+_CALL_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=_CALL_CACHE_SIZE)
+def message_call(token: str) -> str:
+    """Normalize one FT8 message token to a callsign, or '' if it isn't one.
+
+    Strips the <> hash-call brackets and upper-cases before applying
+    the is_callsign heuristic.
+    """
+    call = token.strip('<>').upper()
+    return call if is_callsign(call) else ''
+
+
 # Maximum score tilt at a passband edge at full pattern confidence (±8%).
 # Chosen so the tilt can flip near-ties (two 82-point quiet slots) but never
 # a proven-ideal 100 against a regional-quiet 82 across the full band.
@@ -0,0 +1,433 @@
+"""Array-backed spot storage and passband math for the band map.
+
+The band map ticks four times a second over every spot it holds, so its
+data lives in parallel NumPy columns rather than lists of dicts: cleanup,
+scoring and painting each touch one or two fields across all spots, and
+column slices make those whole-array operations. Nothing here imports Qt,
+so it is testable (and reusable) without a widget.
+
+Copyright (C) 2025 Peter Hirst (WU2C)
+"""
+
+from typing import Iterable, Sequence
+
+import numpy as np
+
+from .geometry import sweep_bias_multiplier
+
+
+class SpotColumns:
+    """Struct-of-arrays spot store: numeric columns plus optional labels.
+
+    Every spot has freq (audio Hz), snr (dB), seen (timestamp) and decay
+    (display/scoring weight, 0-1). Text fields used only for tooltips
+    ("call", "sender", ...) are declared as `labels` and held in object
+    columns so they move with their row on compaction. Fields that
+    scoring groups by are declared as `codes`: int32 columns holding
+    ids the caller interns (see Interner), -1 for none.
+
+    Rows live in preallocated buffers with an `n` cursor; the capacity
+    doubles when an append would overflow. The public columns are views
+    of the first `n` rows, so in-place writes (`cols.decay[:] = ...`)
+    update the store.
+    """
+
+    def __init__(self, labels: Sequence[str] = (), capacity: int = 64,
+                 codes: Sequence[str] = ()):
+        self.n = 0
+        self.labels = tuple(labels)
+        self.codes = tuple(codes)
+        self._freq = np.zeros(capacity, dtype=np.int32)
+        self._snr = np.zeros(capacity, dtype=np.int8)
+        self._seen = np.zeros(capacity, dtype=np.float64)
+        # float64, not float32: decay is compared against exact 0.3/0.4
+        # thresholds, and the fade reaches them exactly at whole seconds.
+        self._decay = np.zeros(capacity, dtype=np.float64)
+        self._labels = {name: np.full(capacity, '', dtype=object)
+                        for name in self.labels}
+        self._codes = {name: np.full(capacity, -1, dtype=np.int32)
+                       for name in self.codes}
+
+    def __len__(self):
+        return self.n
+
+    @property
+    def capacity(self):
+        return len(self._freq)
+
+    @property
+    def freq(self):
+        return self._freq[:self.n]
+
+    @property
+    def snr(self):
+        return self._snr[:self.n]
+
+    @property
+    def seen(self):
+        return self._seen[:self.n]
+
+    @property
+    def decay(self):
+        return self._decay[:self.n]
+
+    def label(self, name: str):
+        return self._labels[name][:self.n]
+
+    def code(self, name: str):
+        return self._codes[name][:self.n]
+
+    def mask(self, min_decay: float, freq_lo: int, freq_hi: int) -> np.ndarray:
+        """Rows with decay > min_decay and freq_lo < freq < freq_hi."""
+        freq = self.freq
+        return (self.decay > min_decay) & (freq > freq_lo) & (freq < freq_hi)
+
+    def _reserve(self, extra: int):
+        needed = self.n + extra
+        if needed <= self.capacity:
+            return
+        size = max(needed, 2 * self.capacity)
+        for attr in ('_freq', '_snr', '_seen', '_decay'):
+            old = getattr(self, attr)
+            grown = np.zeros(size, dtype=old.dtype)
+            grown[:self.n] = old[:self.n]
+            setattr(self, attr, grown)
+        for name, old in self._labels.items():
+            grown = np.full(size, '', dtype=object)
+            grown[:self.n] = old[:self.n]
+            self._labels[name] = grown
+        for name, old in self._codes.items():
+            grown = np.full(size, -1, dtype=np.int32)
+            grown[:self.n] = old[:self.n]
+            self._codes[name] = grown
+
+    def append(self, freq: Iterable[int], snr: Iterable[int], seen: float,
+               decay: float = 1.0, **labels: Iterable):
+        """Append a batch of rows sharing one timestamp and decay.
+
+        Keyword arguments fill label and code columns by name; a column
+        not given defaults to '' (labels) or -1 (codes).
+
+        SNR is clamped to the int8 column range; real reports sit well
+        inside it (PSK Reporter's missing-SNR sentinel is -99).
+        """
+        freq = np.asarray(freq, dtype=np.int32)
+        count = len(freq)
+        if count == 0:
+            return
+        self._reserve(count)
+        lo, hi = self.n, self.n + count
+        self._freq[lo:hi] = freq
+        self._snr[lo:hi] = np.clip(np.asarray(snr, dtype=np.int64), -128, 127)
+        self._seen[lo:hi] = seen
+        self._decay[lo:hi] = decay
+        for name in self.labels:
+            column = self._labels[name]
+            values = labels.get(name)
+            if values is None:
+                column[lo:hi] = ''
+            else:
+                column[lo:hi] = list(values)
+        for name in self.codes:
+            values = labels.get(name)
+            self._codes[name][lo:hi] = -1 if values is None else values
+        self.n = hi
+
+    def compact(self, keep) -> bool:
+        """Keep only rows where the boolean mask `keep` is True, in order.
+
+        Returns True if any row was dropped.
+        """
+        kept = int(np.count_nonzero(keep))
+        if kept == self.n:
+            return False
+        for attr in ('_freq', '_snr', '_seen', '_decay'):
+            buf = getattr(self, attr)
+            buf[:kept] = buf[:self.n][keep]
+        for column in self._labels.values():
+            column[:kept] = column[:self.n][keep]
+            column[kept:self.n] = ''   # drop references to expired labels
+        for column in self._codes.values():
+            column[:kept] = column[:self.n][keep]
+        self.n = kept
+        return True
+
+    def trim_oldest(self, limit: int) -> int:
+        """Drop rows from the front until at most `limit` remain.
+
+        Rows are appended in arrival order, so these are the oldest.
+        Returns the number of rows dropped.
+        """
+        excess = self.n - limit
+        if excess <= 0:
+            return 0
+        self.compact(np.arange(self.n) >= excess)
+        return excess
+
+    def clear(self):
+        for column in self._labels.values():
+            column[:self.n] = ''
+        self.n = 0
+
+
+def decay_ladder(age, full_s: float, bright_s: float, fade_s: float) -> np.ndarray:
+    """Display/scoring weight for spots of the given ages (seconds).
+
+    1.0 under `full_s`, 0.8 under `bright_s`, then a linear fade from
+    0.8 reaching 0 after a further `fade_s` * 0.8 seconds.
+    """
+    age = np.asarray(age, dtype=np.float64)
+    return np.select([age < full_s, age < bright_s],
+                     [1.0, 0.8],
+                     np.maximum(0, 0.8 - ((age - bright_s) / fade_s)))
+
+
+class Interner:
+    """Stable small-integer ids for repeated strings (e.g. callsigns).
+
+    The empty string maps to -1, the "none" value of a code column.
+    """
+
+    def __init__(self):
+        self._ids = {}
+        self.names = []
+
+    def __len__(self):
+        return len(self.names)
+
+    def id(self, name: str) -> int:
+        if not name:
+            return -1
+        ident = self._ids.get(name)
+        if ident is None:
+            ident = self._ids[name] = len(self.names)
+            self.names.append(name)
+        return ident
+
+    def ids(self, names: Iterable[str]) -> np.ndarray:
+        return np.array([self.id(name) for name in names], dtype=np.int32)
+
+    def clear(self):
+        self._ids.clear()
+        self.names.clear()
+
+
+def mark_intervals(freqs, half_width: int, size: int,
+                   guards: Sequence[tuple] = ()) -> np.ndarray:
+    """Boolean occupancy of [f - half_width, f + half_width) for each f.
+
+    `guards` are extra half-open (start, end) spans marked in the same
+    pass — fixed no-go zones such as the passband edges. Intervals are
+    clipped to [0, size). Built as a difference array (+1 at each start,
+    -1 at each end) and a running sum, so the cost is linear in `size`
+    regardless of how many spots overlap.
+    """
+    freqs = np.asarray(freqs, dtype=np.int64)
+    starts = freqs - half_width
+    ends = freqs + half_width
+    if len(guards):
+        spans = np.asarray(guards, dtype=np.int64).reshape(-1, 2)
+        starts = np.concatenate((starts, spans[:, 0]))
+        ends = np.concatenate((ends, spans[:, 1]))
+    starts = np.clip(starts, 0, size)
+    ends = np.clip(ends, 0, size)
+    nonempty = starts < ends
+    delta = (np.bincount(starts[nonempty], minlength=size + 1)
+             - np.bincount(ends[nonempty], minlength=size + 1))
+    return np.cumsum(delta[:size]) > 0
+
+
+def interval_load(freqs, half_width: int, size: int, weight=1) -> np.ndarray:
+    """Per-bin sum of `weight` over every [f - half_width, f + half_width).
+
+    The weighted counterpart of mark_intervals: how many spots (times
+    their weight) cover each bin, from one difference array and cumsum.
+    """
+    freqs = np.asarray(freqs, dtype=np.int64)
+    starts = np.clip(freqs - half_width, 0, size)
+    ends = np.clip(freqs + half_width, 0, size)
+    delta = (np.bincount(starts, minlength=size + 1)
+             - np.bincount(ends, minlength=size + 1))
+    return np.cumsum(delta[:size]) * weight
+
+
+def free_runs(busy: np.ndarray):
+    """Half-open (starts, ends) of every run of False in `busy`, in order."""
+    edges = np.diff(np.concatenate(([0], (~busy).view(np.int8), [0])))
+    return np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)
+
+
+def round_to_bucket(freqs, bucket_size: int = 60) -> np.ndarray:
+    """round(f / bucket_size) * bucket_size for an array of frequencies.
+
+    Halves round to even exactly as Python's round() does, so a spot at
+    90 Hz lands in the 120 bucket and one at 150 Hz in 120 too — the
+    same buckets the scalar code produced. Integer input stays in
+    integer arithmetic (floor divmod plus a branchless half-even
+    correction); anything else goes through np.rint.
+    """
+    freqs = np.asarray(freqs)
+    if freqs.dtype.kind not in 'iu':
+        freqs = freqs.astype(np.float64)
+        return (np.rint(freqs / bucket_size) * bucket_size).astype(np.int64)
+    q, r = np.divmod(freqs.astype(np.int64), bucket_size)
+    twice = 2 * r
+    q += (twice > bucket_size) | ((twice == bucket_size) & (q % 2 == 1))
+    return q * bucket_size
+
+
+def count_by_bucket(freqs, bucket_size: int = 60) -> dict:
+    """{bucket: spot count} for non-negative frequencies.
+
+    Counted with one bincount over bucket indices; keys come out in
+    order of each bucket's first spot, as a dict built spot by spot
+    would have them (callers break score ties on that order).
+    """
+    idx = round_to_bucket(freqs, bucket_size) // bucket_size
+    if len(idx) == 0:
+        return {}
+    counts = np.bincount(idx)
+    _, first = np.unique(idx, return_index=True)
+    return {b * bucket_size: int(counts[b]) for b in idx[np.sort(first)].tolist()}
+
+
+def regional_tally(freqs, reporter_ids, bucket_size: int = 60):
+    """Spots and distinct reporters per bucket, plus total reporters.
+
+    Spots whose reporter id is -1 (unknown) are ignored. Returns
+    ({bucket: spot count}, {bucket: distinct reporters}, distinct
+    reporters overall); both dicts are keyed in first-appearance order.
+    """
+    reporter_ids = np.asarray(reporter_ids)
+    known = reporter_ids >= 0
+    buckets = round_to_bucket(freqs, bucket_size)[known]
+    reporter_ids = reporter_ids[known]
+    signals = count_by_bucket(buckets, bucket_size)
+    # One row per distinct (bucket, reporter) pair, in first-appearance order
+    _, first = np.unique(np.stack((buckets, reporter_ids)), axis=1,
+                         return_index=True)
+    reporters = count_by_bucket(buckets[np.sort(first)], bucket_size)
+    return signals, reporters, len(np.unique(reporter_ids))
+
+
+def group_by_bucket(buckets):
+    """[(bucket, row_indices), ...] in order of each bucket's first row.
+
+    Rows within a group keep their original order. One sort replaces
+    building a dict of per-bucket lists.
+    """
+    buckets = np.asarray(buckets)
+    if len(buckets) == 0:
+        return []
+    uniq, first, inverse, counts = np.unique(
+        buckets, return_index=True, return_inverse=True, return_counts=True)
+    rows = np.split(np.argsort(inverse, kind='stable'), np.cumsum(counts)[:-1])
+    return [(int(uniq[k]), rows[k]) for k in np.argsort(first, kind='stable')]
+
+
+def score_open_bins(scores: np.ndarray, reasons: np.ndarray,
+                    open_bins: np.ndarray, congestion: np.ndarray,
+                    bucket_reporters: np.ndarray, bucket_signals: np.ndarray,
+                    adj_count: np.ndarray, regional_coverage: int):
+    """Steps 5b-5c of the band map recommender, in place.
+
+    All arrays are per bin over the same span. `open_bins` marks bins
+    neither locally busy nor proven by tier1; only those are scored.
+    `congestion` is the summed tier penalty, `bucket_reporters` and
+    `bucket_signals` the distinct regional reporters and spots in each
+    bin's bucket, and `adj_count` the tier1 count in flanking buckets.
+
+    Confidence is continuous: 0 reporters = baseline, 6+ = full trust.
+    No hard threshold — the score itself encodes confidence, and the
+    recommender's later >= 65 check naturally requires ~3+ reporters
+    before acting on regional data.
+    """
+    confidence = min(1.0, regional_coverage / 6.0)
+
+    # Quiet slot — score scales with regional reporter coverage:
+    # 0 reporters → 50 (no data, baseline)
+    # 3 reporters → 66 (crosses recommendation threshold)
+    # 6+ reporters → 82 (strong consensus)
+    quiet = open_bins & (bucket_reporters == 0) & (congestion == 0)
+    # Light activity confirmed by multiple reporters — workable
+    light = (open_bins & ~quiet
+             & (bucket_signals <= 2) & (bucket_reporters >= 2))
+    # Congested — score based on severity
+    congested = open_bins & ~quiet & ~light & (congestion > 0)
+
+    scores[quiet] = 50 + confidence * 32
+    reasons[quiet] = 6 if regional_coverage > 0 else 0
+    scores[light] = 72
+    reasons[light] = 7  # regional_light
+    scores[congested] = np.select(
+        [congestion < 15, congestion < 30, congestion < 50],
+        [55, 45, 35], 25)[congested]
+    reasons[congested] = 8  # congestion
+
+    # 5c: Suspicious gap detection
+    # If tier1 shows heavy activity flanking a frequency slot but
+    # nothing IN the slot, the target's decoder is active nearby yet
+    # finding nothing here — more likely local QRM than clear air.
+    # adj_count 4 → mild (0.94x), 8+ → strong (0.70x)
+    suspicious = open_bins & (adj_count >= 4)
+    suspicion = np.minimum(1.0, (adj_count[suspicious] - 3) / 5.0)
+    scores[suspicious] *= 1.0 - (suspicion * 0.3)
+    reasons[suspicious] = 11  # suspicious_gap
+
+
+def gap_fallback_offset(busy: np.ndarray, current_idx: int, offset: int,
+                        sweep_direction: int = 0,
+                        sweep_confidence: float = 0.0) -> int:
+    """Step 8 of the band map recommender: move toward the widest gap.
+
+    Used when the target has no proven (tier1) or regional data. The
+    widest free run in `busy` wins, with the sweep tilt (pass direction
+    0 when the bias is inactive) breaking near-ties. The offset only
+    moves if the current bin is busy, its gap is narrower than 50 Hz,
+    or the best gap is 1.5x wider — then 30% of the way to the gap
+    centre, clamped to 300-2700 Hz. Returns the (possibly unchanged)
+    offset.
+    """
+    def _sweep_m(freq):
+        if sweep_direction == 0:
+            return 1.0
+        return sweep_bias_multiplier(freq, sweep_direction, sweep_confidence)
+
+    # Find all gaps (runs of free bins, half-open)
+    gap_starts, gap_ends = free_runs(busy)
+    if len(gap_starts) == 0:
+        return offset
+    widths = gap_ends - gap_starts
+    centers = (gap_starts + gap_ends) // 2
+
+    # Current gap width (inclusive span, as the old left/right walk
+    # measured it): the run whose start is the last one <= current_idx
+    current_gap_width = 0
+    if not busy[current_idx]:
+        run = int(np.searchsorted(gap_starts, current_idx, side='right')) - 1
+        current_gap_width = int(widths[run]) - 1
+
+    # Widest gap wins; the sweep tilt (±8% max) breaks near-ties toward
+    # the end of the passband the target sweeps first. argmax keeps the
+    # first of equal scores, as the stable sort did.
+    tilted = widths * np.array([_sweep_m(c) for c in centers.tolist()])
+    best = int(np.argmax(tilted))
+    best_gap_width = int(widths[best])
+    best_center = int(centers[best])
+
+    # Hysteresis for gap-based movement
+    should_move = False
+    current_still_clear = not busy[current_idx]
+
+    if not current_still_clear:
+        should_move = True
+    elif current_gap_width < 50:
+        should_move = True
+    elif best_gap_width > current_gap_width * 1.5:
+        should_move = True
+
+    if should_move:
+        offset = int((offset * 0.7) + (best_center * 0.3))
+        # v2.4.5: Clamp to safe operating range (WSJT-X may reject edges)
+        offset = max(300, min(2700, offset))
+    return offset
@@ -10,14 +10,20 @@
 # - Added: Hover tooltips showing callsign, SNR, tier for signals on band map
 # - Added: Frequency scale with Hz labels along bottom of each section
 
+import itertools
 import logging
 import numpy as np
 import time
 from PyQt6.QtWidgets import QWidget, QApplication, QToolTip
-from PyQt6.QtGui import QPainter, QColor, QPen, QBrush, QFont
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QRectF
+from PyQt6.QtGui import QPainter, QColor, QPen, QBrush, QFont, QPixmap
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QLine, QRect, QRectF
 
 from analyzer.geometry import sweep_bias_multiplier, SWEEP_BIAS_MAX_TILT
+from analyzer.passband import (SpotColumns, Interner, decay_ladder,
+                               mark_intervals, interval_load,
+                               gap_fallback_offset, round_to_bucket,
+                               count_by_bucket, group_by_bucket,
+                               regional_tally, score_open_bins)
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +37,34 @@ class BandMapWidget(QWidget):
     # patterns from steering recommendations.
     SWEEP_BIAS_MIN_CONFIDENCE = 0.55
 
+    # Bars fainter or shorter than this are not sent to the paint engine.
+    # This is a deliberate visual approximation, not a lossless cull: a
+    # lone bar this faint or short barely registers, but where many
+    # overlap and blend their sum can still show, and is dropped.
+    MIN_BAR_ALPHA = 8
+    MIN_BAR_HEIGHT_PX = 0.5
+
+    # Rescoring driven only by spots fading or expiring runs at most this
+    # often (seconds); new data, settings and a moving offset rescore on
+    # the next tick. Fades are gradual, so 2 Hz is imperceptible.
+    FADE_RESCORE_S = 0.5
+
+    # Local decodes held at once. A normal FT8 minute is ~200 decodes;
+    # past this the oldest are dropped at ingest rather than waiting for
+    # the 60 s expiry, bounding a decode burst's scoring and paint cost.
+    MAX_LOCAL_SIGNALS = 512
+
+    # Scoring bucket width (Hz): ~signal width + margin
+    SCORE_BUCKET_HZ = 60
+    # Score graph colour bands: below 20 red, then orange, yellow,
+    # yellow-green, and green from 85 up
+    SCORE_PEN_THRESHOLDS = np.array([20, 40, 60, 85])
+
+    # Text carried by each perspective spot (tier is kept as given), and
+    # the fields scoring groups by, held as interned ids.
+    PERSPECTIVE_LABELS = ('sender', 'sender_grid', 'tier')
+    PERSPECTIVE_CODES = ('receiver',)
+
     def __init__(self):
         super().__init__()
         self.setMinimumHeight(260) 
@@ -46,13 +80,19 @@ class BandMapWidget(QWidget):
         self._tier_names = {1: 'Target', 2: 'Grid', 3: 'Field', 4: 'Global'}
         
         # Data Containers
-        self.active_signals = []   # Local decodes (what WE hear)
+        self.active_signals = SpotColumns(labels=('call',))   # Local decodes (what WE hear)
+        self._signals_truncated = 0   # decodes dropped early by MAX_LOCAL_SIGNALS
         self.perspective_data = {  # Target perspective (tiered)
-            'tier1': [],  # Direct from target
-            'tier2': [],  # Same grid square
-            'tier3': [],  # Same field
-            'global': []  # Background
+            name: SpotColumns(labels=self.PERSPECTIVE_LABELS,
+                              codes=self.PERSPECTIVE_CODES)
+            for name in ('tier1',    # Direct from target
+                         'tier2',    # Same grid square
+                         'tier3',    # Same field
+                         'global')   # Background
         }
+        # Receiver callsign -> id for the 'receiver' code column; rebuilt
+        # with each perspective snapshot
+        self._receivers = Interner()
         
         # State
         self.best_offset = 1500
@@ -65,6 +105,11 @@ class BandMapWidget(QWidget):
         self.score_map = np.zeros(self.bandwidth, dtype=float)
         self.score_reason = np.zeros(self.bandwidth, dtype=np.int8)
         self._scoring_context = {}  # Saved dicts for tooltip detail
+        # Scoring buffers, reused every pass. The score map is double-
+        # buffered: a pass fills the spare and swaps it in, so _tick can
+        # still compare against the previous map without copying it.
+        self._spare_score_map = np.zeros(self.bandwidth, dtype=float)
+        self._congestion_map = np.zeros(self.bandwidth, dtype=float)
         
         # Score reason codes (int8) — see _score_reason_tip() for labels
         # 0=unscored  1=edge  2=hound  3=local_qrm  4=proven_ideal
@@ -76,6 +121,16 @@ class BandMapWidget(QWidget):
         self.manual_override_time = 0
         self.manual_override_duration = 3.0  # seconds
         
+        # Set when data changes outside a setter that repaints itself;
+        # _tick repaints only if this is set or the scores/offset moved
+        self._dirty = True
+        # Set when a scoring input changes (new spots, settings, a manual
+        # offset); _tick skips _calculate_best_frequency otherwise
+        self._score_stale = True
+        # Fades/expiries not yet scored, and when scoring last ran
+        self._fade_pending = False
+        self._last_score_time = 0.0
+        
         # v2.3.0: Fox/Hound mode — clamp recommendations to 1000+ Hz
         self.hound_mode = False
         self.fox_qso_active = False  # Fox controlling our TX — disable click-to-set
@@ -87,12 +142,33 @@ class BandMapWidget(QWidget):
         
         # === PERFORMANCE FIX: Cache all paint objects ===
         self._init_paint_cache()
+        self._init_scoring_tables()
         
         # === PERFORMANCE FIX: Slower timer (was 50ms = 20Hz, now 250ms = 4Hz) ===
+        # The timer stops once the map is idle (see _tick) and any input
+        # that can change the picture restarts it via _wake().
         self.timer = QTimer()
         self.timer.timeout.connect(self._tick)
         self.timer.start(250)
 
+    def _init_scoring_tables(self):
+        """Pre-compute the fixed-shape arrays every scoring pass reads.
+
+        The bandwidth never changes, so the bucket layout of the scored
+        200-2800 Hz span, the sweep-tilt positions and the edge ramps are
+        the same on every pass.
+        """
+        span_buckets, self._bucket_of_bin = np.unique(
+            round_to_bucket(np.arange(200, 2800), self.SCORE_BUCKET_HZ),
+            return_inverse=True)
+        self._span_buckets = span_buckets.tolist()
+        # Position of each bin on the sweep_bias_multiplier curve
+        self._sweep_positions = np.clip(
+            (np.arange(self.bandwidth) - 1500.0) / 1300.0, -1.0, 1.0)
+        steps = np.arange(100)
+        self._edge_ramp_up = steps / 100.0            # 0% at 200, 100% at 300
+        self._edge_ramp_down = (100 - steps) / 100.0  # 100% at 2700, 0% at 2800
+
     def _init_paint_cache(self):
         """Pre-create all paint objects to avoid per-frame allocation overhead."""
         
@@ -140,6 +216,12 @@ class BandMapWidget(QWidget):
             'text_green': QColor("#00FF00"),
             'text_magenta': QColor("#FF00FF"),
             'scale_label': QColor("#999"),  # v2.1.1: Frequency scale text
+            'section_label': QColor(170, 170, 170),  # #AAA — visible but not distracting
+            'legend_label': QColor(180, 180, 180),   # Bright enough to read
+            
+            # v2.3.0: Fox/Hound
+            'fox_alert': QColor("#FF4444"),
+            'fox_zone': QColor(80, 0, 0, 60),        # Dark red overlay
         }
         
         # Fonts
@@ -173,6 +255,10 @@ class BandMapWidget(QWidget):
             'score_dot_yellow': QPen(QColor(255, 255, 0), 3, Qt.PenStyle.DotLine),
             'score_dot_orange': QPen(QColor(255, 128, 0), 3, Qt.PenStyle.DotLine),
             'score_dot_red': QPen(QColor(255, 50, 50), 3, Qt.PenStyle.DotLine),
+            'fox_boundary': QPen(QColor("#FF4444"), 1, Qt.PenStyle.DashLine),
+            # Score legend samples — teal, visible against the score graph
+            'legend_solid': QPen(QColor(0, 220, 180), 2, Qt.PenStyle.SolidLine),
+            'legend_dot': QPen(QColor(0, 220, 180), 2, Qt.PenStyle.DotLine),
         }
         
         # Brushes for legend
@@ -191,6 +277,14 @@ class BandMapWidget(QWidget):
         # Pre-create alpha variants for common colors (indexed by alpha 0-255)
         # We'll create them on-demand and cache
         self._alpha_color_cache = {}
+        
+        # Static paint layers: name -> (key, QPixmap), see _cached_layer
+        self._layer_cache = {}
+        
+        # Bars queued during paintEvent: [((color_key, alpha), [QRectF]), ...]
+        self._bar_batches = []
+        # x range (pixels) of the region being repainted, for bar culling
+        self._paint_span = (0, 0)
 
     def _get_alpha_color(self, base_color_key, alpha):
         """Get a cached color with specific alpha value."""
@@ -201,18 +295,14 @@ class BandMapWidget(QWidget):
             self._alpha_color_cache[cache_key] = color
         return self._alpha_color_cache[cache_key]
 
-    def _get_score_pen(self, score, has_tier1_data):
-        """Get cached pen for score graph based on score value and data availability."""
-        if score >= 85:
-            return self._pens['score_solid_green'] if has_tier1_data else self._pens['score_dot_green']
-        elif score >= 60:
-            return self._pens['score_solid_yellow_green'] if has_tier1_data else self._pens['score_dot_yellow_green']
-        elif score >= 40:
-            return self._pens['score_solid_yellow'] if has_tier1_data else self._pens['score_dot_yellow']
-        elif score >= 20:
-            return self._pens['score_solid_orange'] if has_tier1_data else self._pens['score_dot_orange']
-        else:
-            return self._pens['score_solid_red'] if has_tier1_data else self._pens['score_dot_red']
+    def _score_pens(self, has_tier1_data):
+        """Cached score graph pens, one per SCORE_PEN_THRESHOLDS band, low to high.
+
+        Solid when tier1 (proven) data backs the score, dotted when gap-based.
+        """
+        style = 'solid' if has_tier1_data else 'dot'
+        return tuple(self._pens[f'score_{style}_{band}']
+                     for band in ('red', 'orange', 'yellow', 'yellow_green', 'green'))
 
     def set_target_call(self, call):
         new_call = call.strip().upper()
@@ -220,6 +310,7 @@ class BandMapWidget(QWidget):
             # Pattern belongs to the previous target's session
             self._sweep_direction = 0
             self._sweep_confidence = 0.0
+            self._wake()
         self.target_call = new_call
         self.update()  # PERFORMANCE FIX: was repaint()
 
@@ -233,6 +324,7 @@ class BandMapWidget(QWidget):
         """
         self._sweep_direction = direction
         self._sweep_confidence = confidence
+        self._wake()
 
     def set_target_grid(self, grid):
         self.target_grid = (grid or "").strip().upper()
@@ -240,26 +332,58 @@ class BandMapWidget(QWidget):
     
     def clear(self):
         """Clear all signal data (for band change)."""
-        self.active_signals = []
-        self.perspective_data = {'tier1': [], 'tier2': [], 'tier3': [], 'global': []}
-        self.score_map = np.zeros(self.bandwidth, dtype=float)
+        self.active_signals.clear()
+        for tier in self.perspective_data.values():
+            tier.clear()
+        self._receivers.clear()
+        self.score_map, self._spare_score_map = self._spare_score_map, self.score_map
+        self.score_map.fill(0)
         self._sweep_direction = 0
         self._sweep_confidence = 0.0
+        self._wake()
         self.update()
 
     def update_signals(self, signals):
         """Update local decode signals (what we hear)."""
-        now = time.time()
+        now = time.monotonic()
+        try:
+            # Convert the whole batch at once; a malformed value anywhere
+            # raises, and only then is the batch parsed row by row
+            freqs = np.array([sig.get('freq', 0) for sig in signals], dtype=np.int64)
+            snrs = np.array([sig.get('snr', -20) for sig in signals], dtype=np.int64)
+            calls = [sig.get('call', '') for sig in signals]  # v2.1.1: for tooltip display
+        except (AttributeError, TypeError, ValueError, OverflowError):
+            freqs, snrs, calls = self._parse_signals(signals)
+        keep = (freqs > 0) & (freqs < self.bandwidth)
+        local = self.active_signals
+        local.append(freqs[keep], snrs[keep], now,
+                     call=itertools.compress(calls, keep))
+        # A burst past the cap drops the oldest decodes before their 60 s
+        # expiry; counted, and logged the first time it happens
+        dropped = local.trim_oldest(self.MAX_LOCAL_SIGNALS)
+        if dropped:
+            if not self._signals_truncated:
+                logger.info(f"Band map: more than {self.MAX_LOCAL_SIGNALS} local "
+                            f"decodes held — dropping the oldest early")
+            self._signals_truncated += dropped
+        self._dirty = True  # drawn on the next tick
+        self._wake()
+
+    def _parse_signals(self, signals):
+        """Row-by-row fallback for update_signals: skips malformed signals."""
+        freqs, snrs, calls = [], [], []
         for sig in signals:
             try:
                 freq = int(sig.get('freq', 0))
                 snr = int(sig.get('snr', -20))
                 if freq > 0 and freq < self.bandwidth:
-                    self.active_signals.append({
-                        'freq': freq, 'snr': snr, 'seen': now, 'decay': 1.0,
-                        'call': sig.get('call', ''),  # v2.1.1: for tooltip display
-                    })
-            except: pass
+                    freqs.append(freq)
+                    snrs.append(snr)
+                    calls.append(sig.get('call', ''))
+            except (AttributeError, TypeError, ValueError, OverflowError):
+                continue
+        return (np.array(freqs, dtype=np.int64), np.array(snrs, dtype=np.int64),
+                calls)
 
     def update_perspective(self, perspective_data):
         """
@@ -274,49 +398,79 @@ class BandMapWidget(QWidget):
         
         Each spot may include 'sender' and 'sender_grid' for tooltip display (v2.1.1).
         """
-        now = time.time()
+        now = time.monotonic()
+        
+        # Every tier is replaced, so no old receiver id survives
+        self._receivers.clear()
         
         # Process each tier
         for tier_name in ['tier1', 'tier2', 'tier3', 'global']:
-            tier_spots = perspective_data.get(tier_name, [])
-            processed = []
-            for spot in tier_spots:
-                try:
-                    freq = spot.get('freq', 0)
-                    snr = spot.get('snr', -20)
-                    receiver = spot.get('receiver', '')
-                    processed.append({
-                        'freq': freq,
-                        'snr': snr,
-                        'receiver': receiver,
-                        'sender': spot.get('sender', ''),        # v2.1.1: for tooltip
-                        'sender_grid': spot.get('sender_grid', ''),  # v2.1.1: for tooltip
-                        'seen': now,
-                        'decay': 1.0,
-                        'tier': spot.get('tier', 4)
-                    })
-                except: pass
-            self.perspective_data[tier_name] = processed
+            self._load_tier(self.perspective_data[tier_name],
+                            perspective_data.get(tier_name, []), now)
         
+        self._wake()
         self.update()  # PERFORMANCE FIX: was repaint()
 
+    def _load_tier(self, tier, spots, now, tier_num=None):
+        """Replace a tier's rows with `spots` (dicts), reusing its buffers."""
+        try:
+            # Convert the whole snapshot at once; a malformed value anywhere
+            # raises, and only then is it parsed row by row
+            freqs = np.array([spot.get('freq', 0) for spot in spots], dtype=np.int64)
+            snrs = np.array([spot.get('snr', -20) for spot in spots], dtype=np.int64)
+        except (AttributeError, TypeError, ValueError, OverflowError):
+            spots, freqs, snrs = self._parse_spots(spots)
+        tier.clear()
+        tier.append(
+            freqs, snrs, now,
+            sender=[spot.get('sender', '') for spot in spots],            # v2.1.1: for tooltip
+            sender_grid=[spot.get('sender_grid', '') for spot in spots],  # v2.1.1: for tooltip
+            receiver=self._receivers.ids(spot.get('receiver', '') for spot in spots),
+            tier=[tier_num or spot.get('tier', 4) for spot in spots])
+
+    def _parse_spots(self, spots):
+        """Row-by-row fallback for _load_tier: skips malformed spots."""
+        kept, freqs, snrs = [], [], []
+        for spot in spots:
+            try:
+                freq = int(spot.get('freq', 0))
+                snr = int(spot.get('snr', -20))
+            except (AttributeError, TypeError, ValueError, OverflowError):
+                continue
+            kept.append(spot)
+            freqs.append(freq)
+            snrs.append(snr)
+        return (kept, np.array(freqs, dtype=np.int64),
+                np.array(snrs, dtype=np.int64))
+
     # Legacy method for backward compatibility
     def update_qrm(self, spots):
         """Legacy method - converts to global tier."""
-        now = time.time()
-        for s in spots:
-            s['seen'] = now
-            s['decay'] = 1.0
-            s['tier'] = 4
-        self.perspective_data['global'] = spots
+        self._load_tier(self.perspective_data['global'], spots, time.monotonic(),
+                        tier_num=4)
+        self._wake()
 
     def set_current_tx_freq(self, freq):
+        if freq != self.current_tx_freq:
+            self._update_marker_columns((self.current_tx_freq, freq), 3)
         self.current_tx_freq = freq
-        self.update()  # PERFORMANCE FIX: was repaint()
 
     def set_target_freq(self, freq):
+        if freq != self.target_freq:
+            # The target marker carries a 30 px shaded band
+            self._update_marker_columns((self.target_freq, freq), 17)
         self.target_freq = freq
-        self.update()  # PERFORMANCE FIX: was repaint()
+
+    def _update_marker_columns(self, freqs, half_px):
+        """Schedule a repaint of the full-height strips around vertical
+        markers at `freqs` (0 = no marker) instead of the whole widget.
+        Status updates re-send the same TX/target frequency every few
+        seconds, so unchanged values repaint nothing."""
+        w, h = self.width(), self.height()
+        for freq in freqs:
+            if freq > 0:
+                x = int((freq / 3000) * w)
+                self.update(QRect(x - half_px, 0, 2 * half_px + 1, h))
 
     def set_hound_mode(self, active):
         """v2.3.0: Enable/disable Hound mode frequency clamping.
@@ -327,6 +481,7 @@ class BandMapWidget(QWidget):
                 logger.info("Fox/Hound: Hound mode detected — clamping recommendations to 1000+ Hz")
             else:
                 logger.info("Fox/Hound: Hound mode disabled — full frequency range restored")
+            self._wake()
             self.update()
 
     def set_fox_qso(self, active):
@@ -340,18 +495,53 @@ class BandMapWidget(QWidget):
         self.update()
 
     def _tick(self):
-        self._cleanup_data()
+        # One timestamp per tick, so every array's decay is computed
+        # against the same instant
+        now = time.monotonic()
+        if self._cleanup_data(now):
+            self._dirty = True
+            self._fade_pending = True
+        prev_offset, prev_scores = self.best_offset, self.score_map
         
         # Check if manual override has expired
         if self.manual_override:
-            if time.time() - self.manual_override_time > self.manual_override_duration:
+            if now - self.manual_override_time > self.manual_override_duration:
                 self.manual_override = False
-        
-        # Only auto-calculate if not in manual override
-        if not self.manual_override:
+            self._dirty = True  # countdown text
+        
+        # Only auto-calculate if not in manual override. Scoring depends
+        # only on its inputs and the current offset, so once the offset
+        # stops moving it would just repeat itself until an input changes.
+        # Fades and expiries alone rescore at most every FADE_RESCORE_S.
+        if not self.manual_override and (
+                self._score_stale
+                or (self._fade_pending
+                    and now - self._last_score_time >= self.FADE_RESCORE_S)):
             self._calculate_best_frequency()
-        
-        self.update()  # PERFORMANCE FIX: was repaint()
+            self._last_score_time = now
+            self._fade_pending = False
+            self._score_stale = self.best_offset != prev_offset
+        
+        # Repaint only if something drawn changed since the last tick
+        if (self._dirty or self.best_offset != prev_offset
+                or not np.array_equal(self.score_map, prev_scores)):
+            self._dirty = False
+            self.update()  # PERFORMANCE FIX: was repaint()
+        elif (not self.manual_override and not self._fade_pending
+                and not self._has_spots()):
+            # Idle: nothing left to fade or expire and the recommendation
+            # has settled, so stop waking up until new input arrives
+            self.timer.stop()
+
+    def _has_spots(self):
+        return (len(self.active_signals) > 0
+                or any(len(tier) for tier in self.perspective_data.values()))
+
+    def _wake(self):
+        """Note a scoring input changed; restart the tick timer if idle."""
+        self._score_stale = True
+        if not self.timer.isActive():
+            self.timer.start()
 
     def mousePressEvent(self, event):
         """Handle click to manually set frequency and copy to clipboard."""
@@ -374,7 +564,8 @@ class BandMapWidget(QWidget):
             # Set manual override
             self.best_offset = freq
             self.manual_override = True
-            self.manual_override_time = time.time()
+            self.manual_override_time = time.monotonic()
+            self._wake()  # the override expires on a tick
             
             # Copy to clipboard
             clipboard = QApplication.clipboard()
@@ -439,35 +630,31 @@ class BandMapWidget(QWidget):
         else:
             QToolTip.hideText()
 
-    def _cleanup_data(self):
-        now = time.time()
+    def _cleanup_data(self, now):
+        """Expire and fade spots as of `now` (time.monotonic()).
+        Returns True if any spot expired or faded."""
+        changed = False
         
         # 1. Local Signals - 60 second persistence with decay
-        self.active_signals = [s for s in self.active_signals if now - s['seen'] < 60]
-        for s in self.active_signals:
-            age = now - s['seen']
-            if age < 14:
-                s['decay'] = 1.0
-            elif age < 29:
-                s['decay'] = 0.8
-            else:
-                s['decay'] = max(0, 0.8 - ((age - 29) / 30.0))
+        local = self.active_signals
+        age = now - local.seen
+        keep = age < 60
+        changed |= local.compact(keep)
+        decay = decay_ladder(age[keep], 14, 29, 30.0)
+        changed |= not np.array_equal(decay, local.decay)
+        local.decay[:] = decay
         
         # 2. Perspective data - 180 second persistence with decay
         #    Bridges PSK Reporter upload gaps while showing visual freshness.
         #    Decay: 0-29s full, 29-59s bright, 59-179s fading
-        for tier_name in ['tier1', 'tier2', 'tier3', 'global']:
-            tier_list = self.perspective_data.get(tier_name, [])
-            tier_list = [s for s in tier_list if now - s.get('seen', 0) < 180]
-            for s in tier_list:
-                age = now - s.get('seen', now)
-                if age < 29:
-                    s['decay'] = 1.0
-                elif age < 59:
-                    s['decay'] = 0.8
-                else:
-                    s['decay'] = max(0, 0.8 - ((age - 59) / 120.0))
-            self.perspective_data[tier_name] = tier_list
+        for tier in self.perspective_data.values():
+            age = now - tier.seen
+            keep = age < 180
+            changed |= tier.compact(keep)
+            decay = decay_ladder(age[keep], 29, 59, 120.0)
+            changed |= not np.array_equal(decay, tier.decay)
+            tier.decay[:] = decay
+        return changed
 
     def _calculate_best_frequency(self):
         """
@@ -491,9 +678,10 @@ class BandMapWidget(QWidget):
         Also populates score_map for visualization.
         """
         
-        # Reset score map and reason codes
-        self.score_map = np.full(self.bandwidth, 50.0)  # Default: unproven = 50
-        self.score_reason = np.zeros(self.bandwidth, dtype=np.int8)  # 0 = unscored
+        # Reset score map (swapping in the spare buffer) and reason codes
+        self.score_map, self._spare_score_map = self._spare_score_map, self.score_map
+        self.score_map.fill(50.0)  # Default: unproven = 50
+        self.score_reason.fill(0)  # 0 = unscored
 
         # Sweep bias: when the live pattern tracker sees the target working
         # its pileup methodically toward one end of the passband, tilt
@@ -509,17 +697,16 @@ class BandMapWidget(QWidget):
                                          self._sweep_confidence)
         
         # === STEP 1: Build local busy map (things WE hear - avoid our own QRM) ===
-        local_busy = np.zeros(self.bandwidth, dtype=bool)
-        for s in self.active_signals:
-            if s['decay'] > 0.4:
-                f = s['freq']
-                start = max(0, f - 30)
-                end = min(self.bandwidth, f + 30)
-                local_busy[start:end] = True
+        # Band edges (and the Fox TX zone in Hound mode) are marked busy in
+        # the same pass as the signals.
+        guards = [(0, 200), (2800, 3000)]
+        if self.hound_mode:
+            guards.append((0, 1000))
+        local = self.active_signals
+        local_busy = mark_intervals(local.freq[local.decay > 0.4], 30, self.bandwidth,
+                                    guards=guards)
         
         # Avoid edges - mark as zero score
-        local_busy[0:200] = True
-        local_busy[2800:3000] = True
         self.score_map[0:200] = 0
         self.score_map[2800:3000] = 0
         self.score_reason[0:200] = 1   # edge
@@ -527,29 +714,21 @@ class BandMapWidget(QWidget):
         
         # v2.3.0: Fox/Hound — zero out Fox TX zone when in Hound mode
         if self.hound_mode:
-            local_busy[0:1000] = True
             self.score_map[0:1000] = 0
             self.score_reason[0:1000] = 2  # hound zone
         
         # Mark locally busy areas as low score (but not in hard-zero edge zones)
-        for i in range(200, 2800):
-            if local_busy[i]:
-                self.score_map[i] = 10  # Can't use - local QRM
-                self.score_reason[i] = 3
+        qrm = local_busy[200:2800]
+        self.score_map[200:2800][qrm] = 10  # Can't use - local QRM
+        self.score_reason[200:2800][qrm] = 3
         
         # === STEP 2: Analyze tier1 (cyan) - frequencies where target IS decoding ===
-        tier1_spots = self.perspective_data.get('tier1', [])
-        tier1_freqs = [
-            s.get('freq', 0) for s in tier1_spots 
-            if s.get('decay', 0) > 0.4 and 200 < s.get('freq', 0) < 2800
-        ]
+        tier1 = self.perspective_data['tier1']
+        tier1_freqs = tier1.freq[tier1.mask(0.4, 200, 2800)]
         
         # === STEP 3: Bucket tier1 frequencies to count density ===
-        bucket_size = 60  # ~signal width + margin
-        tier1_buckets = {}  # bucket_center -> count
-        for freq in tier1_freqs:
-            bucket = round(freq / bucket_size) * bucket_size
-            tier1_buckets[bucket] = tier1_buckets.get(bucket, 0) + 1
+        bucket_size = self.SCORE_BUCKET_HZ
+        tier1_buckets = count_by_bucket(tier1_freqs, bucket_size)  # bucket_center -> count
         
         # === STEP 4: Score proven frequencies and populate score_map ===
         proven_candidates = []  # (freq, score, count)
@@ -569,9 +748,9 @@ class BandMapWidget(QWidget):
             # Tier1 proven data OVERRIDES local_busy: in FT8, TX and RX alternate
             # on 15s cycles — a local signal at your TX frequency doesn't prevent
             # you from transmitting there. The target's perspective is what matters.
-            for i in range(max(0, bucket - 30), min(self.bandwidth, bucket + 30)):
-                self.score_map[i] = max(self.score_map[i], score)
-                self.score_reason[i] = reason
+            window = slice(max(0, bucket - 30), min(self.bandwidth, bucket + 30))
+            np.maximum(self.score_map[window], score, out=self.score_map[window])
+            self.score_reason[window] = reason
             
             # Candidate ordering (and the Step 7 hysteresis comparison) uses
             # the sweep-tilted score; the raw score already went into the
@@ -588,26 +767,14 @@ class BandMapWidget(QWidget):
         # can only decode a limited number of signals per FT8 cycle, so a
         # single reporter's silence is a sample, not a census. Five reporters
         # all seeing quiet is a consensus.
-        regional_bucket_reporters = {}   # bucket -> set of reporter callsigns
-        regional_bucket_signals = {}     # bucket -> total signal count
-        all_regional_reporters = set()   # all distinct reporters in tier2/tier3
-
-        for tier_name in ['tier2', 'tier3']:
-            for s in self.perspective_data.get(tier_name, []):
-                if s.get('decay', 0) > 0.3:
-                    f = s.get('freq', 0)
-                    if 200 < f < 2800:
-                        bucket = round(f / bucket_size) * bucket_size
-                        receiver = s.get('receiver', '')
-                        if receiver:
-                            all_regional_reporters.add(receiver)
-                            if bucket not in regional_bucket_reporters:
-                                regional_bucket_reporters[bucket] = set()
-                                regional_bucket_signals[bucket] = 0
-                            regional_bucket_reporters[bucket].add(receiver)
-                            regional_bucket_signals[bucket] += 1
-
-        regional_coverage = len(all_regional_reporters)
+        regional = [self.perspective_data[name] for name in ('tier2', 'tier3')]
+        rows = [tier.mask(0.3, 200, 2800) for tier in regional]
+        (regional_bucket_signals,      # bucket -> total signal count
+         regional_bucket_reporters,    # bucket -> distinct reporters
+         regional_coverage) = regional_tally(  # distinct reporters in tier2/tier3
+            np.concatenate([t.freq[r] for t, r in zip(regional, rows)]),
+            np.concatenate([t.code('receiver')[r] for t, r in zip(regional, rows)]),
+            bucket_size)
 
         # Build tier1 adjacency map for suspicious gap detection (Step 5c).
         # For each bucket, sum tier1 signal count in neighboring buckets
@@ -641,98 +808,48 @@ class BandMapWidget(QWidget):
 
         # 5a: Build congestion map from tier2/tier3/global spots
         tier_penalties = {'tier2': 20, 'tier3': 15, 'global': 8}
-        congestion_map = np.zeros(self.bandwidth, dtype=float)
+        congestion_map = self._congestion_map
+        congestion_map.fill(0)
 
         for tier_name, penalty in tier_penalties.items():
-            for s in self.perspective_data.get(tier_name, []):
-                if s.get('decay', 0) > 0.3:
-                    f = s.get('freq', 0)
-                    if 200 < f < 2800:
-                        for i in range(max(0, f - 30), min(self.bandwidth, f + 30)):
-                            congestion_map[i] += penalty
-
-        # 5b: Score non-tier1 frequencies using regional intelligence
-        # Confidence is continuous: 0 reporters = baseline, 6+ = full trust.
-        # No hard threshold — the score itself encodes confidence, and
-        # downstream thresholds (Step 7b's >= 65) naturally require ~3+
-        # reporters before acting on regional data.
-        confidence = min(1.0, regional_coverage / 6.0)
-
-        for i in range(200, 2800):
-            if local_busy[i]:
-                continue  # Already marked as 10
-
-            bucket_for_i = round(i / bucket_size) * bucket_size
-            if bucket_for_i in tier1_buckets:
-                continue  # Already scored in Step 4
-
-            congestion = congestion_map[i]
-            bucket_reporters = len(regional_bucket_reporters.get(bucket_for_i, set()))
-            bucket_signals = regional_bucket_signals.get(bucket_for_i, 0)
-
-            if bucket_reporters == 0 and congestion == 0:
-                # Quiet slot — score scales with regional reporter coverage:
-                # 0 reporters → 50 (no data, baseline)
-                # 3 reporters → 66 (crosses recommendation threshold)
-                # 6+ reporters → 82 (strong consensus)
-                self.score_map[i] = 50 + confidence * 32
-                self.score_reason[i] = 6 if regional_coverage > 0 else 0
-
-            elif bucket_signals <= 2 and bucket_reporters >= 2:
-                # Light activity confirmed by multiple reporters — workable
-                self.score_map[i] = 72
-                self.score_reason[i] = 7  # regional_light
-
-            elif congestion > 0:
-                # Congested — score based on severity
-                if congestion < 15:
-                    self.score_map[i] = 55
-                elif congestion < 30:
-                    self.score_map[i] = 45
-                elif congestion < 50:
-                    self.score_map[i] = 35
-                else:
-                    self.score_map[i] = 25
-                self.score_reason[i] = 8  # congestion
-
-        # 5c: Suspicious gap detection
-        # If tier1 shows heavy activity flanking a frequency slot but
-        # nothing IN the slot, the target's decoder is active nearby yet
-        # finding nothing here — more likely local QRM than clear air.
-        for i in range(200, 2800):
-            if local_busy[i]:
-                continue
-            bucket_for_i = round(i / bucket_size) * bucket_size
-            if bucket_for_i in tier1_buckets:
-                continue  # Proven bucket, not a gap
-
-            adj_count = tier1_adjacency.get(bucket_for_i, 0)
-            if adj_count >= 4:
-                # Heavy tier1 flanking — dampen score
-                # adj_count 4 → mild (0.94x), 8+ → strong (0.70x)
-                suspicion = min(1.0, (adj_count - 3) / 5.0)
-                dampen = 1.0 - (suspicion * 0.3)
-                self.score_map[i] *= dampen
-                self.score_reason[i] = 11  # suspicious_gap
+            tier = self.perspective_data[tier_name]
+            congestion_map += interval_load(tier.freq[tier.mask(0.3, 200, 2800)],
+                                            30, self.bandwidth, penalty)
+
+        # 5b/5c: Score non-tier1 frequencies using regional intelligence,
+        # then dampen suspicious gaps (passband.score_open_bins). Each
+        # bin's inputs are gathered per bucket, looked up once per bucket
+        # rather than per bin.
+        bin_buckets = self._span_buckets
+
+        def _per_bin(values):
+            return np.array(values)[self._bucket_of_bin]
+
+        open_bins = ~local_busy[200:2800] & ~_per_bin(
+            [b in tier1_buckets for b in bin_buckets])  # not yet scored
+        score_open_bins(
+            self.score_map[200:2800], self.score_reason[200:2800], open_bins,
+            congestion_map[200:2800],
+            _per_bin([regional_bucket_reporters.get(b, 0) for b in bin_buckets]),
+            _per_bin([regional_bucket_signals.get(b, 0) for b in bin_buckets]),
+            _per_bin([tier1_adjacency.get(b, 0) for b in bin_buckets]),
+            regional_coverage)
 
         # 5d: Apply the sweep-bias tilt to the whole map (same curve as
         # sweep_bias_multiplier, vectorized), then clamp back to the 0-100
         # scale so display and the persisted rec_score keep their contract.
         # This is what Step 7b's argmax and the recorded score read.
         if sweep_active:
-            positions = np.clip(
-                (np.arange(self.bandwidth) - 1500.0) / 1300.0, -1.0, 1.0)
             sign = 1.0 if self._sweep_direction > 0 else -1.0
             conf = min(1.0, self._sweep_confidence)
-            self.score_map *= 1.0 + sign * conf * SWEEP_BIAS_MAX_TILT * positions
+            self.score_map *= (1.0 + sign * conf * SWEEP_BIAS_MAX_TILT
+                               * self._sweep_positions)
             np.clip(self.score_map, 0.0, 100.0, out=self.score_map)
 
         # Save context for tooltip display
         self._scoring_context = {
             'tier1_buckets': tier1_buckets,
-            'regional_bucket_reporters': {
-                k: len(v) for k, v in regional_bucket_reporters.items()
-            },
+            'regional_bucket_reporters': regional_bucket_reporters,
             'regional_bucket_signals': regional_bucket_signals,
             'regional_coverage': regional_coverage,
             'tier1_adjacency': tier1_adjacency,
@@ -741,10 +858,8 @@ class BandMapWidget(QWidget):
         
         # v2.3.0: Soft edge penalty — gentle ramp near band edges
         # Discourages recommendations near edges where decoder performance degrades
-        for i in range(200, 300):
-            self.score_map[i] *= (i - 200) / 100.0  # 0% at 200, 100% at 300
-        for i in range(2700, 2800):
-            self.score_map[i] *= (2800 - i) / 100.0  # 100% at 2700, 0% at 2800
+        self.score_map[200:300] *= self._edge_ramp_up      # 0% at 200, 100% at 300
+        self.score_map[2700:2800] *= self._edge_ramp_down  # 100% at 2700, 0% at 2800
         
         # === STEP 6: Check current position status ===
         current_idx = max(200, min(2800, self.best_offset))
@@ -835,72 +950,16 @@ class BandMapWidget(QWidget):
         
         # Mark tier2/tier3/global as potential hazards (but not tier1 - those are good!)
         tier_weights = {'tier2': 0.8, 'tier3': 0.5, 'global': 0.3}
+        hazard_freqs = []
         for tier_name, weight in tier_weights.items():
-            for s in self.perspective_data.get(tier_name, []):
-                if s.get('decay', 0) > 0.4 * weight:
-                    f = s.get('freq', 0)
-                    if 0 < f < self.bandwidth:
-                        start = max(0, f - 20)
-                        end = min(self.bandwidth, f + 20)
-                        busy_map[start:end] = True
-        
-        # Find current gap width
-        current_gap_width = 0
-        if not busy_map[current_idx]:
-            left = current_idx
-            while left > 0 and not busy_map[left - 1]:
-                left -= 1
-            right = current_idx
-            while right < self.bandwidth - 1 and not busy_map[right + 1]:
-                right += 1
-            current_gap_width = right - left
-        
-        # Find all gaps
-        gaps = []
-        gap_start = -1
-        for i in range(len(busy_map)):
-            if not busy_map[i]:
-                if gap_start == -1:
-                    gap_start = i
-            else:
-                if gap_start != -1:
-                    gaps.append((gap_start, i))
-                    gap_start = -1
-        if gap_start != -1:
-            gaps.append((gap_start, self.bandwidth))
-        
-        if not gaps:
-            return
+            tier = self.perspective_data[tier_name]
+            hazard_freqs.append(tier.freq[tier.mask(0.4 * weight, 0, self.bandwidth)])
+        busy_map |= mark_intervals(np.concatenate(hazard_freqs), 20, self.bandwidth)
         
-        # Widest gap wins; the sweep tilt (±8% max) breaks near-ties toward
-        # the end of the passband the target sweeps first.
-        gaps.sort(key=lambda x: (x[1] - x[0]) * _sweep_m((x[0] + x[1]) // 2),
-                  reverse=True)
-        best_gap = gaps[0]
-        best_gap_width = best_gap[1] - best_gap[0]
-        best_center = (best_gap[0] + best_gap[1]) // 2
-        
-        # Hysteresis for gap-based movement
-        should_move = False
-        current_still_clear = not busy_map[current_idx]
-        
-        if not current_still_clear:
-            should_move = True
-        elif current_gap_width < 50:
-            should_move = True
-        elif best_gap_width > current_gap_width * 1.5:
-            should_move = True
-        
-        if should_move:
-            self.best_offset = int((self.best_offset * 0.7) + (best_center * 0.3))
-            # v2.4.5: Clamp to safe operating range (WSJT-X may reject edges)
-            self.best_offset = max(300, min(2700, self.best_offset))
-
-    def _normalize_call(self, call):
-        if not call: return ""
-        call = call.replace('<', '').replace('>', '').upper()
-        if '/' in call: return max(call.split('/'), key=len)
-        return call
+        self.best_offset = gap_fallback_offset(
+            busy_map, current_idx, self.best_offset,
+            self._sweep_direction if sweep_active else 0,
+            self._sweep_confidence)
 
     def _score_reason_tip(self, freq):
         """Build tooltip text explaining why a frequency has its current score."""
@@ -952,6 +1011,9 @@ class BandMapWidget(QWidget):
         
         # v2.1.1: Clear tooltip hit-test list for this frame
         self._tooltip_bars = []
+        # Partial repaints (marker moves) only need bars under the update rect
+        dirty = event.rect()
+        self._paint_span = (dirty.left(), dirty.right() + 1)
         
         # Layout: Top (40%) | Score Graph (15%) | Bottom (45%)
         top_h = int(h * 0.40)
@@ -964,37 +1026,11 @@ class BandMapWidget(QWidget):
         self._score_section_top = score_top
         self._score_section_bottom = score_top + score_h
         
-        # 1. Background - use cached color
-        qp.fillRect(0, 0, w, h, self._colors['background'])
-        
-        # v2.3.0: Fox/Hound mode — dim the Fox TX zone (0-1000 Hz)
-        if self.hound_mode:
-            fox_x = int((1000 / self.bandwidth) * w)
-            qp.fillRect(0, 0, fox_x, h, QColor(80, 0, 0, 60))  # Dark red overlay
-            qp.setPen(QColor("#FF4444"))
-            qp.setFont(self._fonts.get('medium_bold', QFont("Consolas", 9, QFont.Weight.Bold)))
-            qp.drawText(5, top_h // 2, "FOX TX ZONE")
-            # Draw boundary line at 1000 Hz
-            pen = QPen(QColor("#FF4444"))
-            pen.setStyle(Qt.PenStyle.DashLine)
-            pen.setWidth(1)
-            qp.setPen(pen)
-            qp.drawLine(fox_x, 0, fox_x, h)
-        
-        # Grid lines - use cached pen
-        qp.setPen(self._pens['grid'])
-        for i in range(0, 3000, 500):
-            x = (i / 3000) * w
-            qp.drawLine(int(x), 0, int(x), h)
-        
-        # Section dividers - use cached pen
-        qp.setPen(self._pens['divider'])
-        qp.drawLine(0, top_h, w, top_h)
-        qp.drawLine(0, bottom_top, w, bottom_top)
-        
-        # v2.1.1: Frequency scale along bottom of perspective and local sections
-        self._draw_freq_scale(qp, w, top_h - 1, 'above')       # Perspective section
-        self._draw_freq_scale(qp, w, h - 1, 'above')            # Local section
+        # 1. Background, grid, scales and score strip: static until the
+        # size or Hound mode changes, so blitted from a cached pixmap
+        qp.drawPixmap(0, 0, self._cached_layer(
+            'background', (self.hound_mode,),
+            lambda p: self._draw_background(p, w, h, top_h, score_top, score_h, bottom_top)))
 
         # 2. PLACEHOLDER TEXT if no target selected (top section)
         if not self.target_call:
@@ -1009,43 +1045,38 @@ class BandMapWidget(QWidget):
             # 3. DRAW PERSPECTIVE LAYERS (Top Section) - Back to Front
             qp.setPen(Qt.PenStyle.NoPen)
             
+            # Bars are queued and drawn with one drawRects call per run
+            # of the same fill; each layer is flushed before the next.
             # Layer 4: Global (dimmest) - Gray-purple
-            for spot in self.perspective_data.get('global', []):
-                self._draw_perspective_bar(qp, spot, w, top_h, 0, 'tier4', 0.3)
+            self._draw_perspective_bars(qp, self.perspective_data['global'], w, top_h, 0, 'tier4', 0.3)
+            self._flush_bars(qp)
             
             # Layer 3: Same Field - Violet
-            for spot in self.perspective_data.get('tier3', []):
-                self._draw_perspective_bar(qp, spot, w, top_h, 0, 'tier3', 0.5)
+            self._draw_perspective_bars(qp, self.perspective_data['tier3'], w, top_h, 0, 'tier3', 0.5)
+            self._flush_bars(qp)
             
             # Layer 2: Same Grid Square - Purple
-            for spot in self.perspective_data.get('tier2', []):
-                self._draw_perspective_bar(qp, spot, w, top_h, 0, 'tier2', 0.8)
+            self._draw_perspective_bars(qp, self.perspective_data['tier2'], w, top_h, 0, 'tier2', 0.8)
+            self._flush_bars(qp)
             
             # Layer 1: Direct from Target - Cyan (highest priority)
             # First, bucket them to count density
-            tier1_spots = self.perspective_data.get('tier1', [])
-            bucket_size = 60
-            tier1_buckets = {}  # bucket -> list of spots
-            for spot in tier1_spots:
-                if spot.get('decay', 0) > 0.3:
-                    freq = spot.get('freq', 0)
-                    if 200 < freq < 2800:
-                        bucket = round(freq / bucket_size) * bucket_size
-                        if bucket not in tier1_buckets:
-                            tier1_buckets[bucket] = []
-                        tier1_buckets[bucket].append(spot)
+            tier1 = self.perspective_data['tier1']
+            tier1_rows = np.flatnonzero(tier1.mask(0.3, 200, 2800))
+            buckets = round_to_bucket(tier1.freq[tier1_rows])
             
             # Draw each tier1 spot with color based on bucket density
-            for bucket, spots in tier1_buckets.items():
-                count = len(spots)
-                for spot in spots:
-                    if count <= 3:
-                        color_key = 'tier1_bright'
-                    elif count <= 5:
-                        color_key = 'tier1_medium'
-                    else:
-                        color_key = 'tier1_dim'
-                    self._draw_perspective_bar(qp, spot, w, top_h, 0, color_key, 1.0)
+            for bucket, rows in group_by_bucket(buckets):
+                count = len(rows)
+                if count <= 3:
+                    color_key = 'tier1_bright'
+                elif count <= 5:
+                    color_key = 'tier1_medium'
+                else:
+                    color_key = 'tier1_dim'
+                self._draw_perspective_bars(qp, tier1, w, top_h, 0, color_key, 1.0,
+                                            rows=tier1_rows[rows])
+                self._flush_bars(qp)
                 
                 # Draw count label at the bucket center
                 x = int((bucket / 3000) * w)
@@ -1062,40 +1093,35 @@ class BandMapWidget(QWidget):
         self._draw_score_graph(qp, w, score_h, score_top)
 
         # 6. DRAW LOCAL LAYERS (Bottom Section)
-        for s in self.active_signals:
-            freq = s['freq']
-            snr = s['snr']
-            decay = s['decay']
-            x = (freq / 3000) * w
-            bar_width = (50 / 3000) * w 
-            alpha = int(255 * decay)
-            
-            # Use cached colors with alpha
-            if snr > 0:
-                color_key = 'local_strong'
-            elif snr > -10:
-                color_key = 'local_medium'
-            else:
-                color_key = 'local_weak'
-            
-            col = self._get_alpha_color(color_key, alpha)
-            norm = max(0, min(1, (snr + 24) / 44))
-            bar_h = bottom_h * 0.9 * norm
-            
-            rect = QRectF(x - (bar_width/2), h - bar_h, bar_width, bar_h)
-            qp.setBrush(QBrush(col))
+        # Bar geometry for every signal is computed as arrays up front;
+        # the only per-bar Python work is building the QRectF.
+        local = self.active_signals
+        snrs = local.snr.astype(np.float64)
+        xs = (local.freq / 3000) * w
+        bar_width = (50 / 3000) * w
+        alphas = (255 * local.decay).astype(np.int64)
+        # Use cached colors with alpha
+        color_keys = np.where(snrs > 0, 'local_strong',
+                              np.where(snrs > -10, 'local_medium', 'local_weak'))
+        bar_hs = bottom_h * 0.9 * np.clip((snrs + 24) / 44, 0, 1)
+        
+        rects = [QRectF(x - (bar_width/2), h - bar_h, bar_width, bar_h)
+                 for x, bar_h in zip(xs.tolist(), bar_hs.tolist())]
+        self._queue_bars(color_keys, alphas, bar_hs, rects, xs, bar_width / 2)
+        
+        # v2.1.1: Register for tooltip (local signals show message callsign)
+        calls = local.label('call')
+        for i in np.flatnonzero(calls.astype(bool) & (local.decay > 0.3)).tolist():
+            self._tooltip_bars.append((rects[i], {
+                'sender': calls[i],
+                'snr': int(local.snr[i]),
+                'freq': int(local.freq[i]),
+                'section': 'local',
+            }))
+
+        if self._bar_batches:
             qp.setPen(Qt.PenStyle.NoPen)
-            qp.drawRect(rect)
-            
-            # v2.1.1: Register for tooltip (local signals show message callsign)
-            call = s.get('call', '')
-            if call and decay > 0.3:
-                self._tooltip_bars.append((rect, {
-                    'sender': call,
-                    'snr': snr,
-                    'freq': freq,
-                    'section': 'local',
-                }))
+            self._flush_bars(qp)
 
         # 7. VERTICAL OVERLAYS (span full height)
         # Target frequency marker
@@ -1117,7 +1143,7 @@ class BandMapWidget(QWidget):
         if self.fox_qso_active:
             # v2.3.0: Fox is controlling TX — hide recommendation, show message
             qp.setFont(self._fonts['medium_bold'])
-            qp.setPen(QColor("#FF4444"))
+            qp.setPen(self._colors['fox_alert'])
             qp.drawText(int(w * 0.3), score_top + score_h // 2 + 4, "FOX CONTROLLING TX FREQUENCY")
         elif self.best_offset > 0:
             x = (self.best_offset / 3000) * w
@@ -1129,91 +1155,190 @@ class BandMapWidget(QWidget):
             
             # If in manual override, show countdown
             if self.manual_override:
-                remaining = self.manual_override_duration - (time.time() - self.manual_override_time)
+                remaining = self.manual_override_duration - (time.monotonic() - self.manual_override_time)
                 if remaining > 0:
                     qp.setFont(self._fonts['medium_bold'])
                     qp.setPen(self._colors['text_green'])
                     qp.drawText(int(x) + 8, score_top + score_h - 5, f"{remaining:.1f}s")
             
-        # 8. LEGEND
-        self._draw_legend(qp)
-
-    def _draw_perspective_bar(self, qp, spot, w, section_h, section_top, color_key, opacity_mult):
-        """Draw a bar in the perspective section representing target's view."""
-        freq = spot.get('freq', 0)
-        snr = spot.get('snr', -20)
-        decay = spot.get('decay', 1.0)
+        # 8. LEGEND (static, drawn over everything from a cached overlay)
+        qp.drawPixmap(0, 0, self._cached_layer('legend', (), self._draw_legend))
+
+    def _cached_layer(self, name, key, draw):
+        """Pixmap of draw(painter) at the widget's size, re-rendered only when
+        the size, device pixel ratio or `key` changes. Starts transparent, so
+        a layer can also be composited over the dynamic content."""
+        w, h = self.width(), self.height()
+        dpr = self.devicePixelRatioF()
+        full_key = (w, h, dpr) + tuple(key)
+        cached = self._layer_cache.get(name)
+        if cached is not None and cached[0] == full_key:
+            return cached[1]
+        pixmap = QPixmap(round(w * dpr), round(h * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        draw(painter)
+        painter.end()
+        self._layer_cache[name] = (full_key, pixmap)
+        return pixmap
+
+    def _draw_background(self, qp, w, h, top_h, score_top, score_h, bottom_top):
+        """Static layers under the spot bars (cached by paintEvent)."""
+        # 1. Background - use cached color
+        qp.fillRect(0, 0, w, h, self._colors['background'])
         
-        if freq <= 0 or freq >= self.bandwidth:
-            return
+        # v2.3.0: Fox/Hound mode — dim the Fox TX zone (0-1000 Hz)
+        if self.hound_mode:
+            fox_x = int((1000 / self.bandwidth) * w)
+            qp.fillRect(0, 0, fox_x, h, self._colors['fox_zone'])
+            qp.setPen(self._colors['fox_alert'])
+            qp.setFont(self._fonts['medium_bold'])
+            qp.drawText(5, top_h // 2, "FOX TX ZONE")
+            # Draw boundary line at 1000 Hz
+            qp.setPen(self._pens['fox_boundary'])
+            qp.drawLine(fox_x, 0, fox_x, h)
         
-        alpha = int(255 * decay * opacity_mult)
-        color = self._get_alpha_color(color_key, alpha)
+        # Grid lines - use cached pen
+        qp.setPen(self._pens['grid'])
+        for i in range(0, 3000, 500):
+            x = (i / 3000) * w
+            qp.drawLine(int(x), 0, int(x), h)
         
-        x = (freq / 3000) * w
-        bar_width = (40 / 3000) * w
+        # Section dividers - use cached pen
+        qp.setPen(self._pens['divider'])
+        qp.drawLine(0, top_h, w, top_h)
+        qp.drawLine(0, bottom_top, w, bottom_top)
         
+        # v2.1.1: Frequency scale along bottom of perspective and local sections
+        self._draw_freq_scale(qp, w, top_h - 1, 'above')       # Perspective section
+        self._draw_freq_scale(qp, w, h - 1, 'above')            # Local section
+
+        # Score section background and 50% line (unproven baseline)
+        qp.fillRect(0, score_top, w, score_h, self._colors['background_dark'])
+        y_50 = score_top + score_h * 0.5
+        qp.setPen(self._pens['baseline_dot'])
+        qp.drawLine(0, int(y_50), w, int(y_50))
+
+    def _draw_perspective_bars(self, qp, tier, w, section_h, section_top, color_key,
+                               opacity_mult, rows=slice(None)):
+        """Draw bars in the perspective section representing target's view."""
+        freqs = tier.freq[rows]
+        on_band = (freqs > 0) & (freqs < self.bandwidth)
+        freqs = freqs[on_band]
+        snrs = tier.snr[rows][on_band]
+        decays = tier.decay[rows][on_band]
+        
+        # Geometry for the whole layer at once
+        xs = (freqs / 3000) * w
+        bar_width = (40 / 3000) * w
+        alphas = (255 * decays * opacity_mult).astype(np.int64)
         # Height based on SNR
-        norm = max(0.1, min(1.0, (snr + 25) / 35))
-        bar_h = section_h * 0.9 * norm
+        bar_hs = section_h * 0.9 * np.clip((snrs.astype(np.float64) + 25) / 35, 0.1, 1.0)
         
-        rect = QRectF(x - (bar_width/2), section_top, bar_width, bar_h)
-        qp.setBrush(QBrush(color))
-        qp.drawRect(rect)
+        rects = [QRectF(x - (bar_width/2), section_top, bar_width, bar_h)
+                 for x, bar_h in zip(xs.tolist(), bar_hs.tolist())]
+        self._queue_bars(color_key, alphas, bar_hs, rects, xs, bar_width / 2)
         
         # v2.1.1: Register for tooltip hit-testing (only if visible enough)
-        if decay > 0.3 and opacity_mult > 0.2:
-            self._tooltip_bars.append((rect, {
-                'sender': spot.get('sender', ''),
-                'snr': snr,
-                'freq': freq,
-                'tier': spot.get('tier', 4),
-                'sender_grid': spot.get('sender_grid', ''),
-                'section': 'perspective',
-            }))
+        if opacity_mult > 0.2:
+            senders = tier.label('sender')[rows][on_band]
+            grids = tier.label('sender_grid')[rows][on_band]
+            tier_nums = tier.label('tier')[rows][on_band]
+            for i in np.flatnonzero(decays > 0.3).tolist():
+                self._tooltip_bars.append((rects[i], {
+                    'sender': senders[i],
+                    'snr': int(snrs[i]),
+                    'freq': int(freqs[i]),
+                    'tier': tier_nums[i],
+                    'sender_grid': grids[i],
+                    'section': 'perspective',
+                }))
+
+    def _queue_bars(self, color_keys, alphas, heights, rects, xs, half_width):
+        """Queue a layer's bars for _flush_bars, one run per fill.
+
+        `color_keys` is one key for the whole layer or one per bar. Bars
+        below MIN_BAR_ALPHA / MIN_BAR_HEIGHT_PX (an approximation, see
+        there), or centred at `xs` but lying wholly outside the x range
+        being repainted, are dropped. Only consecutive bars are coalesced,
+        so the draw order (and hence the blend where translucent bars
+        overlap) is unchanged.
+        """
+        left, right = self._paint_span
+        visible = np.flatnonzero((alphas >= self.MIN_BAR_ALPHA)
+                                 & (heights >= self.MIN_BAR_HEIGHT_PX)
+                                 & (xs + half_width >= left)
+                                 & (xs - half_width <= right))
+        if not len(visible):
+            return
+        keys = np.broadcast_to(np.asarray(color_keys, dtype=object),
+                               alphas.shape)[visible]
+        fills = alphas[visible]
+        # A run starts wherever the color or alpha differs from the bar before
+        starts = np.flatnonzero(np.concatenate((
+            [True], (keys[1:] != keys[:-1]) | (fills[1:] != fills[:-1]))))
+        ends = np.append(starts[1:], len(visible))
+        batches = self._bar_batches
+        for start, end in zip(starts.tolist(), ends.tolist()):
+            fill = (keys[start], int(fills[start]))
+            run = [rects[i] for i in visible[start:end].tolist()]
+            if batches and batches[-1][0] == fill:
+                batches[-1][1].extend(run)
+            else:
+                batches.append((fill, run))
+
+    def _flush_bars(self, qp):
+        """Draw queued bars with one drawRects call per run of one fill.
+
+        Bars are axis-aligned fills, so they are drawn without
+        antialiasing: the rasterizer's coverage path costs close to half
+        of the frame and only softens edges by a fraction of a pixel.
+        """
+        qp.setRenderHint(QPainter.RenderHint.Antialiasing, False)
+        for (color_key, alpha), rects in self._bar_batches:
+            qp.setBrush(self._get_alpha_color(color_key, alpha))
+            qp.drawRects(rects)
+        self._bar_batches.clear()
+        qp.setRenderHint(QPainter.RenderHint.Antialiasing)
 
     def _draw_score_graph(self, qp, w, section_h, section_top):
         """Draw the score visualization graph in the middle section."""
         
-        # Background for score section
-        qp.fillRect(0, section_top, w, section_h, self._colors['background_dark'])
-        
+        # Section background and 50% line come from the cached background
+        # layer (_draw_background).
         # v2.2.0: Old "Score" label removed — section label on right replaces it
         
-        # 50% line (unproven baseline)
-        y_50 = section_top + section_h * 0.5
-        qp.setPen(self._pens['baseline_dot'])
-        qp.drawLine(0, int(y_50), w, int(y_50))
-        
         # Check if we have tier1 data (proven frequencies)
-        tier1_spots = self.perspective_data.get('tier1', [])
-        has_tier1_data = len([s for s in tier1_spots if s.get('decay', 0) > 0.3]) > 0
+        has_tier1_data = bool(np.any(self.perspective_data['tier1'].decay > 0.3))
         
         # Draw score line
         if len(self.score_map) > 0:
-            # Downsample for performance (draw every 3rd pixel)
+            # Downsample for performance (draw every 3rd pixel): one
+            # reshape-mean over the whole buckets, plus the short tail
             step = max(1, self.bandwidth // w) * 3
+            whole = (self.bandwidth // step) * step
+            avg = self.score_map[:whole].reshape(-1, step).mean(axis=1)
+            if whole < self.bandwidth:
+                avg = np.append(avg, np.mean(self.score_map[whole:]))
+            starts = np.arange(0, self.bandwidth, step)
             
-            prev_x = None
-            prev_y = None
+            xs = ((starts / self.bandwidth) * w).astype(int).tolist()
+            # Map score 0-100 to section height (inverted - high score = top)
+            ys = np.clip((section_top + section_h * (1.0 - avg / 100.0)).astype(int),
+                         section_top + 2, section_top + section_h - 2).tolist()
             
-            for i in range(0, self.bandwidth, step):
-                # Get average score in this bucket
-                end_i = min(i + step, self.bandwidth)
-                avg_score = np.mean(self.score_map[i:end_i])
-                
-                x = int((i / self.bandwidth) * w)
-                # Map score 0-100 to section height (inverted - high score = top)
-                y = int(section_top + section_h * (1.0 - avg_score / 100.0))
-                y = max(section_top + 2, min(section_top + section_h - 2, y))
-                
-                # Draw line segment using cached pen
-                if prev_x is not None:
-                    qp.setPen(self._get_score_pen(avg_score, has_tier1_data))
-                    qp.drawLine(prev_x, prev_y, x, y)
-                
-                prev_x = x
-                prev_y = y
+            # Each segment takes the pen of its end point; consecutive
+            # segments sharing a pen band go out in one drawLines call
+            pens = self._score_pens(has_tier1_data)
+            bands = np.searchsorted(self.SCORE_PEN_THRESHOLDS, avg[1:], side='right')
+            run_starts = np.flatnonzero(np.concatenate(([True], bands[1:] != bands[:-1])))
+            run_ends = np.append(run_starts[1:], len(bands))
+            for start, end in zip(run_starts.tolist(), run_ends.tolist()):
+                qp.setPen(pens[bands[start]])
+                qp.drawLines([QLine(xs[k], ys[k], xs[k + 1], ys[k + 1])
+                              for k in range(start, end)])
         
         # v2.2.0: Gap-based indicator now shown via dotted line style in legend
         # Old "(gap-based scoring)" label removed to avoid overlap with section labels
@@ -1280,7 +1405,7 @@ class BandMapWidget(QWidget):
     def _draw_section_labels(self, qp, w, top_h, score_top, score_h, bottom_top):
         """v2.2.0: Draw right-aligned section labels for each band map area."""
         qp.setFont(self._fonts['small_bold'])  # 8pt bold — compact but readable
-        label_color = QColor(170, 170, 170)  # #AAA — visible but not distracting
+        label_color = self._colors['section_label']
         
         margin = 6
         label_h = 12
@@ -1353,23 +1478,20 @@ class BandMapWidget(QWidget):
     def _draw_score_legend(self, qp, w, score_top):
         """v2.2.0: Draw score graph legend — solid vs dotted line meaning."""
         qp.setFont(self._fonts['small_bold'])  # 8pt bold — matches section labels
-        label_color = QColor(180, 180, 180)  # Bright enough to read
-        sample_color = QColor(0, 220, 180)   # Teal — visible against score graph
+        label_color = self._colors['legend_label']
         
         # Vertically center in the section: section is 15% of height
         # Place legend at left, just below the section label
         y = score_top + 14
         
         # Solid line sample + "proven"
-        pen_solid = QPen(sample_color, 2, Qt.PenStyle.SolidLine)
-        qp.setPen(pen_solid)
+        qp.setPen(self._pens['legend_solid'])
         qp.drawLine(10, y, 32, y)
         qp.setPen(label_color)
         qp.drawText(36, y + 4, "proven")
         
         # Dotted line sample + "gap-based" — good spacing from first
-        pen_dot = QPen(sample_color, 2, Qt.PenStyle.DotLine)
-        qp.setPen(pen_dot)
+        qp.setPen(self._pens['legend_dot'])
         qp.drawLine(90, y, 112, y)
         qp.setPen(label_color)
         qp.drawText(116, y + 4, "gap-based")
@@ -72,3 +72,46 @@ def outcome_recorder_home(tmp_path, monkeypatch):
     monkeypatch.setenv('HOME', str(tmp_path))
     monkeypatch.setenv('USERPROFILE', str(tmp_path))
     return tmp_path / '.qso-predictor' / 'outcome_history.jsonl'
+
+
+class _StubSignal:
+    def connect(self, slot, *args):
+        pass
+
+
+class StubMQTTClient:
+    """Offline stand-in for mqtt_client.MQTTClient (no broker connection)."""
+
+    def __init__(self):
+        self.spot_received = _StubSignal()
+        self.status_message = _StubSignal()
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+    def update_subscriptions(self, my_call, freq):
+        pass
+
+
+@pytest.fixture
+def analyzer(monkeypatch):
+    """A QSOAnalyzer for WU2C/FN31 on the 20m FT8 dial, offline.
+
+    Spots are fed straight to handle_live_spot; prune and status passes
+    are called directly. The background loops are stopped on teardown.
+    """
+    import analyzer.core as core
+
+    monkeypatch.setattr(core, 'MQTTClient', StubMQTTClient)
+    qa = core.QSOAnalyzer(StubConfig({
+        ('ANALYSIS', 'my_callsign'): 'WU2C',
+        ('ANALYSIS', 'my_grid'): 'FN31',
+    }))
+    qa.set_dial_freq(14074000)
+
+    yield qa
+
+    qa.stop()
@@ -0,0 +1,51 @@
+# QSO Predictor test suite
+# Copyright (C) 2026 Peter Hirst (WU2C)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+"""The analyzer's status line ("Tracking N stations | ...").
+
+Cache pruning runs every PRUNE_INTERVAL_S (10 s) but the status line
+refreshes every 2 s; the station count must not wait for a prune, so
+it is right straight after startup or a band change.
+"""
+
+import time
+
+from PyQt6.QtCore import Qt
+
+
+def _spot(sender, receiver='K1ABC', grid='FN42', t=None):
+    return {'sender': sender, 'receiver': receiver, 'grid': grid,
+            'freq': 14075000, 'snr': -10, 'mode': 'FT8',
+            'time': time.time() if t is None else t}
+
+
+def _status(analyzer):
+    lines = []
+    analyzer.status_message.connect(lines.append,
+                                    Qt.ConnectionType.DirectConnection)
+    analyzer._emit_status(time.time())
+    analyzer.status_message.disconnect(lines.append)
+    return lines[-1]
+
+
+def test_count_is_current_before_the_first_prune(analyzer):
+    for call in ('DL1AA', 'G4BB', 'JA1CC', 'DL1AA'):
+        analyzer.handle_live_spot(_spot(call))
+    assert 'Tracking 3 stations' in _status(analyzer)
+
+
+def test_band_change_resets_the_count(analyzer):
+    analyzer.handle_live_spot(_spot('DL1AA'))
+    analyzer.set_dial_freq(7074000)
+    assert 'Tracking 0 stations' in _status(analyzer)
+
+
+def test_senders_older_than_retention_not_counted(analyzer):
+    analyzer.handle_live_spot(_spot('DL1AA', t=time.time() - 16 * 60))
+    analyzer.handle_live_spot(_spot('G4BB'))
+    assert 'Tracking 1 stations' in _status(analyzer)
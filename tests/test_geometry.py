@@ -96,6 +96,28 @@ class TestIsCallsign:
         assert geometry.is_callsign("<WU2C>") is True
 
 
+class TestMessageCall:
+    """Memoized token normalizer used on the per-decode path."""
+
+    @pytest.mark.parametrize("token,expected", [
+        ("wu2c", "WU2C"),
+        ("<JA1XYZ>", "JA1XYZ"),
+        ("ZL2/M0ABC", "ZL2/M0ABC"),
+        ("RR73", "RR73"),       # loose heuristic — see TestIsCallsign
+        ("CQ", ""),
+        ("-12", ""),
+        ("<...>", ""),
+    ])
+    def test_message_call(self, token, expected):
+        assert geometry.message_call(token) == expected
+
+    def test_repeat_tokens_hit_the_cache(self):
+        geometry.message_call.cache_clear()
+        geometry.message_call("<W1AW>")
+        geometry.message_call("<W1AW>")
+        assert geometry.message_call.cache_info().hits == 1
+
+
 # --- bearing_to_region ----------------------------------------------------
 
 
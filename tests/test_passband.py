@@ -0,0 +1,342 @@
+# QSO Predictor test suite
+# Copyright (C) 2026 Peter Hirst (WU2C)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+"""Tests for analyzer.passband — the band map's array-backed spot store
+and passband math.
+
+The band map widget itself imports QtWidgets and isn't constructed in
+tests; everything it computes over spot columns lives here instead.
+"""
+
+import numpy as np
+import pytest
+
+from analyzer.passband import (Interner, SpotColumns, count_by_bucket,
+                               decay_ladder, free_runs, gap_fallback_offset,
+                               group_by_bucket, interval_load, mark_intervals,
+                               regional_tally, round_to_bucket, score_open_bins)
+
+
+class TestSpotColumns:
+
+    def test_append_and_views(self):
+        cols = SpotColumns(labels=('call',))
+        cols.append([1000, 1500], [-5, 3], 10.0, call=['K1ABC', 'W1AW'])
+        assert len(cols) == 2
+        assert cols.freq.tolist() == [1000, 1500]
+        assert cols.snr.tolist() == [-5, 3]
+        assert cols.seen.tolist() == [10.0, 10.0]
+        assert cols.decay.tolist() == [1.0, 1.0]
+        assert cols.label('call').tolist() == ['K1ABC', 'W1AW']
+
+    def test_grows_past_initial_capacity(self):
+        cols = SpotColumns(capacity=2)
+        for i in range(5):
+            cols.append([100 * (i + 1)], [0], float(i))
+        assert cols.capacity >= 5
+        assert cols.freq.tolist() == [100, 200, 300, 400, 500]
+        assert cols.seen.tolist() == [0.0, 1.0, 2.0, 3.0, 4.0]
+
+    def test_snr_clamped_to_column_range(self):
+        cols = SpotColumns()
+        cols.append([1000, 1100, 1200], [-99, 500, -500], 0.0)
+        assert cols.snr.tolist() == [-99, 127, -128]
+
+    def test_missing_label_defaults_to_empty(self):
+        cols = SpotColumns(labels=('sender', 'sender_grid'))
+        cols.append([700], [-10], 0.0, sender=['DL1ABC'])
+        assert cols.label('sender_grid').tolist() == ['']
+
+    def test_compact_keeps_order_and_labels(self):
+        cols = SpotColumns(labels=('call',))
+        cols.append([100, 200, 300, 400], [1, 2, 3, 4], 0.0,
+                    call=['A1A', 'B2B', 'C3C', 'D4D'])
+        assert cols.compact(np.array([False, True, False, True])) is True
+        assert cols.freq.tolist() == [200, 400]
+        assert cols.snr.tolist() == [2, 4]
+        assert cols.label('call').tolist() == ['B2B', 'D4D']
+
+    def test_compact_keeping_everything_reports_no_change(self):
+        cols = SpotColumns()
+        cols.append([100, 200], [0, 0], 0.0)
+        assert cols.compact(np.array([True, True])) is False
+        assert len(cols) == 2
+
+    def test_trim_oldest_drops_from_the_front(self):
+        cols = SpotColumns(labels=('call',))
+        cols.append([100, 200], [1, 2], 0.0, call=['A1A', 'B2B'])
+        cols.append([300, 400], [3, 4], 1.0, call=['C3C', 'D4D'])
+        assert cols.trim_oldest(3) == 1
+        assert cols.freq.tolist() == [200, 300, 400]
+        assert cols.seen.tolist() == [0.0, 1.0, 1.0]
+        assert cols.label('call').tolist() == ['B2B', 'C3C', 'D4D']
+
+    def test_trim_oldest_under_limit_is_a_no_op(self):
+        cols = SpotColumns()
+        cols.append([100, 200], [0, 0], 0.0)
+        assert cols.trim_oldest(2) == 0
+        assert cols.freq.tolist() == [100, 200]
+
+    def test_views_write_through(self):
+        cols = SpotColumns()
+        cols.append([100, 200], [0, 0], 0.0)
+        cols.decay[:] = [0.5, 0.25]
+        assert cols.decay.tolist() == [0.5, 0.25]
+
+    def test_mask_is_strict_on_every_bound(self):
+        cols = SpotColumns()
+        cols.append([200, 201, 1500, 2799, 2800], [0] * 5, 0.0)
+        cols.decay[:] = [1.0, 1.0, 0.4, 0.41, 1.0]
+        assert cols.mask(0.4, 200, 2800).tolist() == [False, True, False, True, False]
+
+    def test_code_columns_follow_their_rows(self):
+        cols = SpotColumns(codes=('receiver',), capacity=2)
+        cols.append([100, 200, 300], [0] * 3, 0.0, receiver=[4, -1, 7])
+        cols.append([400], [0], 1.0)
+        assert cols.code('receiver').tolist() == [4, -1, 7, -1]
+        cols.compact(np.array([True, False, True, True]))
+        assert cols.code('receiver').tolist() == [4, 7, -1]
+
+    def test_clear(self):
+        cols = SpotColumns(labels=('call',))
+        cols.append([100], [0], 0.0, call=['A1A'])
+        cols.clear()
+        assert len(cols) == 0
+        assert cols.freq.tolist() == []
+
+
+class TestInterner:
+
+    def test_ids_are_stable_and_dense(self):
+        names = Interner()
+        assert names.ids(['W1AW', 'K1ABC', 'W1AW']).tolist() == [0, 1, 0]
+        assert names.id('K1ABC') == 1
+        assert names.names == ['W1AW', 'K1ABC']
+
+    def test_empty_is_none(self):
+        names = Interner()
+        assert names.ids(['', None, 'W1AW']).tolist() == [-1, -1, 0]
+        assert len(names) == 1
+
+    def test_clear_restarts_ids(self):
+        names = Interner()
+        names.ids(['W1AW', 'K1ABC'])
+        names.clear()
+        assert names.id('K1ABC') == 0
+
+
+class TestDecayLadder:
+
+    def test_steps_then_fades(self):
+        decay = decay_ladder([0, 13.9, 14, 28.9, 29, 44, 53, 60], 14, 29, 30.0)
+        assert decay.tolist() == pytest.approx([1.0, 1.0, 0.8, 0.8, 0.8, 0.3, 0.0, 0.0])
+
+    def test_matches_scalar_ladder(self):
+        ages = np.arange(0, 200, 0.25)
+        expected = [1.0 if a < 29 else 0.8 if a < 59 else max(0, 0.8 - (a - 59) / 120.0)
+                    for a in ages]
+        assert decay_ladder(ages, 29, 59, 120.0).tolist() == expected
+
+
+class TestIntervalLoad:
+
+    def test_matches_per_bin_accumulation(self):
+        rng = np.random.default_rng(3)
+        freqs = rng.integers(-40, 1040, size=50)
+        expected = np.zeros(1000)
+        for f in freqs:
+            for i in range(max(0, f - 30), min(1000, f + 30)):
+                expected[i] += 15
+        assert np.array_equal(interval_load(freqs, 30, 1000, 15), expected)
+
+    def test_overlaps_add_up(self):
+        load = interval_load([100, 110], 10, 200, 8)
+        assert load[90:100].tolist() == [8] * 10
+        assert load[100:110].tolist() == [16] * 10
+        assert load[110:120].tolist() == [8] * 10
+        assert load[120] == 0 and load[89] == 0
+
+    def test_empty_input(self):
+        assert not interval_load([], 30, 100, 20).any()
+
+
+def _slice_marked(freqs, half_width, size):
+    """The per-spot slice loop mark_intervals replaces."""
+    busy = np.zeros(size, dtype=bool)
+    for f in freqs:
+        busy[max(0, f - half_width):min(size, f + half_width)] = True
+    return busy
+
+
+class TestMarkIntervals:
+
+    def test_single_interval_is_half_open(self):
+        busy = mark_intervals([100], 30, 300)
+        assert np.flatnonzero(busy).tolist() == list(range(70, 130))
+
+    def test_clipped_at_both_edges(self):
+        busy = mark_intervals([10, 295], 30, 300)
+        assert busy[0] and busy[39] and not busy[40]
+        assert busy[265] and busy[299] and not busy[264]
+
+    def test_guards_marked_with_signals(self):
+        busy = mark_intervals([500], 10, 1000, guards=[(0, 100), (950, 1200)])
+        assert busy[:100].all() and not busy[100]
+        assert busy[490:510].all() and not busy[489] and not busy[510]
+        assert busy[950:].all() and not busy[949]
+
+    def test_guards_without_signals(self):
+        busy = mark_intervals([], 30, 100, guards=[(10, 20)])
+        assert np.flatnonzero(busy).tolist() == list(range(10, 20))
+
+    def test_empty_input(self):
+        assert not mark_intervals([], 30, 300).any()
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_matches_slice_marking(self, seed):
+        rng = np.random.default_rng(seed)
+        freqs = rng.integers(1, 3000, size=40).tolist()
+        assert np.array_equal(mark_intervals(freqs, 30, 3000),
+                              _slice_marked(freqs, 30, 3000))
+
+
+class TestFreeRuns:
+
+    def test_runs_including_band_ends(self):
+        busy = np.zeros(20, dtype=bool)
+        busy[5:8] = True
+        busy[12] = True
+        starts, ends = free_runs(busy)
+        assert list(zip(starts.tolist(), ends.tolist())) == [(0, 5), (8, 12), (13, 20)]
+
+    def test_all_busy_has_no_runs(self):
+        starts, ends = free_runs(np.ones(10, dtype=bool))
+        assert len(starts) == len(ends) == 0
+
+    def test_all_free_is_one_run(self):
+        starts, ends = free_runs(np.zeros(10, dtype=bool))
+        assert (starts.tolist(), ends.tolist()) == ([0], [10])
+
+
+class TestBuckets:
+
+    def test_round_to_bucket_matches_python_round(self):
+        # Exact halves (30, 90, 150 Hz past a bucket) round to even like round()
+        freqs = list(range(0, 3001, 5))
+        assert round_to_bucket(freqs).tolist() == [round(f / 60) * 60 for f in freqs]
+
+    def test_round_to_bucket_negative_and_odd_sizes(self):
+        freqs = list(range(-200, 201))
+        for size in (60, 7):
+            assert round_to_bucket(np.array(freqs, dtype=np.int32), size).tolist() == [
+                round(f / size) * size for f in freqs]
+
+    def test_round_to_bucket_float_input(self):
+        assert round_to_bucket([89.9, 90.0, 150.0, 150.5]).tolist() == [60, 120, 120, 180]
+
+    def test_counts_in_first_appearance_order(self):
+        # 1230 Hz is an exact half and rounds to the even bucket (1200)
+        counts = count_by_bucket([1210, 610, 1190, 650, 1230, 1200])
+        assert list(counts.items()) == [(1200, 4), (600, 1), (660, 1)]
+
+    def test_count_empty(self):
+        assert count_by_bucket(np.array([], dtype=np.int32)) == {}
+
+    def test_regional_tally(self):
+        freqs = [1210, 1190, 610, 1200, 600, 1500]
+        reporters = [3, 3, 5, 4, 5, -1]
+        signals, per_bucket, coverage = regional_tally(freqs, reporters)
+        assert list(signals.items()) == [(1200, 3), (600, 2)]
+        assert list(per_bucket.items()) == [(1200, 2), (600, 1)]
+        assert coverage == 3
+
+    def test_regional_tally_empty(self):
+        assert regional_tally([], np.array([], dtype=np.int32)) == ({}, {}, 0)
+
+    def test_groups_in_first_appearance_order(self):
+        groups = group_by_bucket([600, 120, 600, 240, 120, 600])
+        assert [(b, rows.tolist()) for b, rows in groups] == [
+            (600, [0, 2, 5]), (120, [1, 4]), (240, [3])]
+
+    def test_group_empty(self):
+        assert group_by_bucket([]) == []
+
+
+class TestScoreOpenBins:
+
+    @staticmethod
+    def _score(open_bins, congestion, reporters, signals, adj, coverage):
+        size = len(open_bins)
+        scores = np.full(size, 50.0)
+        reasons = np.zeros(size, dtype=np.int8)
+        score_open_bins(scores, reasons, np.array(open_bins),
+                        np.array(congestion, dtype=float), np.array(reporters),
+                        np.array(signals), np.array(adj), coverage)
+        return scores.tolist(), reasons.tolist()
+
+    def test_quiet_scales_with_coverage(self):
+        assert self._score([True], [0], [0], [0], [0], 3) == ([66.0], [6])
+        assert self._score([True], [0], [0], [0], [0], 9) == ([82.0], [6])
+        # No reporters anywhere: baseline score, reason left unscored
+        assert self._score([True], [0], [0], [0], [0], 0) == ([50.0], [0])
+
+    def test_light_beats_congestion(self):
+        assert self._score([True], [35], [2], [2], [0], 4) == ([72.0], [7])
+
+    def test_congestion_ladder(self):
+        scores, reasons = self._score([True] * 4, [8, 20, 43, 60],
+                                      [1] * 4, [3] * 4, [0] * 4, 4)
+        assert scores == [55.0, 45.0, 35.0, 25.0]
+        assert reasons == [8] * 4
+
+    def test_closed_bins_untouched(self):
+        assert self._score([False], [60], [0], [0], [9], 6) == ([50.0], [0])
+
+    def test_suspicious_gap_dampened(self):
+        scores, reasons = self._score([True, True], [0, 0], [0, 0], [0, 0],
+                                      [3, 8], 6)
+        assert scores == pytest.approx([82.0, 82.0 * 0.7])
+        assert reasons == [6, 11]
+
+
+def _busy_except(*free):
+    """3000-bin busy map with the given half-open free ranges."""
+    busy = np.ones(3000, dtype=bool)
+    for start, end in free:
+        busy[start:end] = False
+    return busy
+
+
+class TestGapFallbackOffset:
+
+    def test_moves_off_a_busy_bin_toward_widest_gap(self):
+        busy = _busy_except((400, 500), (1800, 2200))
+        # 30% of the way from 1000 to the 2000 Hz gap centre
+        assert gap_fallback_offset(busy, 1000, 1000) == 1300
+
+    def test_holds_in_a_wide_enough_gap(self):
+        busy = _busy_except((900, 1100), (1800, 2000))
+        assert gap_fallback_offset(busy, 1000, 1000) == 1000
+
+    def test_leaves_a_gap_that_is_much_narrower(self):
+        busy = _busy_except((980, 1060), (1500, 2100))
+        assert gap_fallback_offset(busy, 1000, 1000) == 1240
+
+    def test_no_gaps_keeps_offset(self):
+        assert gap_fallback_offset(np.ones(3000, dtype=bool), 1000, 1000) == 1000
+
+    def test_result_clamped_to_safe_range(self):
+        busy = _busy_except((0, 200))
+        assert gap_fallback_offset(busy, 320, 320) == 300   # 254 unclamped
+
+    def test_sweep_tilt_breaks_tie_toward_favoured_end(self):
+        busy = _busy_except((500, 700), (2300, 2500))
+        assert gap_fallback_offset(busy, 1500, 1500) == 1230   # first gap
+        assert gap_fallback_offset(busy, 1500, 1500,
+                                   sweep_direction=1,
+                                   sweep_confidence=1.0) == 1770
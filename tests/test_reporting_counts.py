@@ -17,7 +17,8 @@ unique callsigns, not total spots" fix on the Tracking side.
 """
 
 from analyzer.core import (count_unique_reporters,
-                           count_unique_reporters_near)
+                           count_unique_reporters_near,
+                           first_report_by_receiver)
 
 
 def _report(receiver, grid='FN31', t=1000.0):
@@ -66,6 +67,18 @@ def test_near_target_handles_missing_or_short_grids():
     assert count_unique_reporters_near(reports, 'GN') == 0
 
 
+def test_first_report_by_receiver_matches_a_front_to_back_scan():
+    """The path checks' "did <call> report me?" index returns the same
+    report the old linear scan found first."""
+    reports = [_report('K1ABC', t=1000), _report('GN1AA', t=1010),
+               _report('K1ABC', t=1030)]
+    index = first_report_by_receiver(reports)
+    assert index['K1ABC'] is reports[0]
+    assert index['GN1AA'] is reports[1]
+    assert 'W1AW' not in index
+    assert first_report_by_receiver([]) == {}
+
+
 # ---------------------------------------------------------------------------
 # Band gating (v2.7.0 field report: Mac on 10m displayed "12 reporting
 # WU2C" — live 20m receptions of the OTHER same-call station, because
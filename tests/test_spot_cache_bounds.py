@@ -0,0 +1,96 @@
+# QSO Predictor test suite
+# Copyright (C) 2026 Peter Hirst (WU2C)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+"""Bounds on the analyzer's spot caches.
+
+On a busy contest band the whole-band MQTT subscription delivers
+thousands of spots a minute; a fixed 15-minute retention let the
+spot caches reach 100k+ dicts. The number of distinct senders in the
+sender and band caches is now capped with least-recently-heard
+eviction and a 5-minute grace window: no sender a live query can still
+see is evicted, and the path checks' receiver/grid caches are left
+whole.
+"""
+
+import time
+
+import analyzer.core as core
+from analyzer.core import senders_to_evict
+
+
+class TestLeastRecentlyHeardEviction:
+
+    @staticmethod
+    def _cache(counts):
+        """{call: n} -> sender_cache with n spots, newest at t=1000+n."""
+        return {call: [{'sender': call, 'time': 1000 + i} for i in range(n)]
+                for call, n in counts.items()}
+
+    def test_under_cap_evicts_nothing(self):
+        assert senders_to_evict(self._cache({'K1A': 1, 'K2B': 1}), 2) == set()
+
+    def test_least_recently_heard_go_first(self):
+        cache = self._cache({'K1A': 5, 'K2B': 1, 'K3C': 3, 'K4D': 2})
+        # last heard: K1A 1004, K2B 1000, K3C 1002, K4D 1001
+        assert senders_to_evict(cache, 2) == {'K2B', 'K4D'}
+
+    def test_ties_broken_by_fewest_spots(self):
+        cache = self._cache({'K1A': 1, 'K2B': 3})
+        cache['K1A'][0]['time'] = 1002     # both last heard at t=1002
+        assert senders_to_evict(cache, 1) == {'K1A'}
+
+    def test_fresh_one_off_sender_survives(self):
+        now = 10000
+        cache = {
+            'K1A': [{'sender': 'K1A', 'time': now - 5}],               # just heard
+            'K2B': [{'sender': 'K2B', 'time': now - 14 * 60},
+                    {'sender': 'K2B', 'time': now - 13 * 60}],         # stale repeat
+            'K3C': [{'sender': 'K3C', 'time': now - 10 * 60}],         # stale
+        }
+        evicted = senders_to_evict(cache, 1, protect_after=now - 300)
+        assert evicted == {'K2B', 'K3C'}
+
+    def test_protected_senders_may_exceed_cap(self):
+        now = 10000
+        cache = {call: [{'sender': call, 'time': now - 60}]
+                 for call in ('K1A', 'K2B', 'K3C')}
+        assert senders_to_evict(cache, 1, protect_after=now - 300) == set()
+
+    def test_pinned_sender_survives(self):
+        cache = self._cache({'WU2C': 1, 'K2B': 4, 'K3C': 4})
+        assert senders_to_evict(cache, 2, pinned={'WU2C'}) == {'K2B'}
+
+
+class TestEvictionKeepsPathStatus:
+
+    @staticmethod
+    def _spot(sender, receiver, grid, age):
+        return {'sender': sender, 'receiver': receiver, 'grid': grid,
+                'freq': 14075000, 'snr': -10, 'mode': 'FT8',
+                'time': time.time() - age}
+
+    def _path(self, analyzer):
+        decode = {'call': 'JA1TGT', 'grid': 'PM95', 'freq': 1500,
+                  'snr': -10, 'message': 'CQ JA1TGT PM95'}
+        analyzer.analyze_decode(decode)
+        return decode['path']
+
+    def test_evicted_reporters_still_count_as_near_target(self, analyzer,
+                                                           monkeypatch):
+        # I'm heard in Europe; the only reporter near the target (JA2RX
+        # in PM95) spotted a stale sender 10 minutes ago
+        analyzer.handle_live_spot(self._spot('WU2C', 'DL1RX', 'JO31', 30))
+        analyzer.handle_live_spot(self._spot('OLD1', 'JA2RX', 'PM95', 600))
+        before = self._path(analyzer)
+
+        monkeypatch.setattr(core, 'MAX_TRACKED_SENDERS', 1)
+        analyzer._prune_caches(time.time())
+
+        assert 'OLD1' not in analyzer.sender_cache   # cap was enforced
+        assert before == "Not Reported in Region"
+        assert self._path(analyzer) == before